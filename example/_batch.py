@@ -0,0 +1,51 @@
+"""Helper for running several independent prompts concurrently.
+
+Each ``agent.run`` waits on a Claude Code CLI subprocess, so independent
+prompts can overlap instead of running back to back. A semaphore bounds the
+number of in-flight runs; 2-8 concurrent requests is usually the sweet spot
+before CLI-side rate limits make additional concurrency counterproductive.
+
+Usage::
+
+    from _batch import run_batch
+
+    results = await run_batch(agent, ["prompt 1", "prompt 2"])
+"""
+
+import asyncio
+from collections.abc import Sequence
+
+from pydantic_ai import Agent
+from pydantic_ai.agent import AgentRunResult
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+async def run_batch[DepsT, OutputT](
+    agent: Agent[DepsT, OutputT],
+    prompts: Sequence[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[AgentRunResult[OutputT]]:
+    """Run *prompts* through *agent* concurrently.
+
+    Args:
+        agent: The agent to run each prompt with.
+        prompts: Independent prompts to run.
+        max_concurrency: Maximum number of runs in flight at once.
+
+    Returns:
+        Run results in the same order as *prompts*.
+
+    Raises:
+        ValueError: If max_concurrency is not a positive integer.
+    """
+    if max_concurrency <= 0:
+        raise ValueError("max_concurrency must be a positive integer")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(prompt: str) -> AgentRunResult[OutputT]:
+        async with semaphore:
+            return await agent.run(prompt)
+
+    return await asyncio.gather(*(run_one(prompt) for prompt in prompts))
@@ -0,0 +1,29 @@
+"""Entry-point helper for the example scripts.
+
+Usage::
+
+    from _runner import run_main
+
+    run_main(main())
+"""
+
+import asyncio
+from collections.abc import Coroutine
+
+
+def run_main[T](main: Coroutine[object, object, T]) -> T:
+    """Run *main* on uvloop when it is installed, else on asyncio.
+
+    uvloop's libuv-based event loop makes subprocess I/O faster.
+
+    Args:
+        main: The example's entry coroutine.
+
+    Returns:
+        The value returned by *main*.
+    """
+    try:
+        from uvloop import run  # type: ignore[import-not-found]
+    except ImportError:
+        return asyncio.run(main)
+    return run(main)
@@ -5,9 +5,9 @@ Prerequisites:
     - Valid authentication configured for Claude Code CLI
 """
 
-import asyncio
 import sys
 
+from _runner import run_main
 from pydantic_ai import Agent
 
 from claudecode_model import ClaudeCodeModel
@@ -44,7 +44,7 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_main(main())
     except CLINotFoundError as e:
         print(f"CLI not found: {e}", file=sys.stderr)
         sys.exit(1)
@@ -7,7 +7,9 @@ Prerequisites:
 
 import asyncio
 import sys
+from pathlib import Path
 
+from _runner import run_main
 from pydantic_ai import Agent
 
 from claudecode_model import ClaudeCodeModel
@@ -17,6 +19,9 @@ from claudecode_model.exceptions import (
     CLIResponseParseError,
 )
 
+# Number of per-file analyses allowed to run at the same time
+MAX_CONCURRENCY = 4
+
 
 async def main() -> None:
     """Run an agent that analyzes files in the current directory."""
@@ -35,24 +40,47 @@ async def main() -> None:
         ),
     )
 
-    result = await agent.run(
-        "このディレクトリにあるPythonファイルの構造を分析し、"
-        "主要なクラスと関数を一覧してください。"
-    )
+    # 1ファイルにつき1プロンプトを用意し、TaskGroupで並行実行する
+    # (いずれかが失敗すると残りのタスクはキャンセルされる)
+    files = sorted(Path(".").glob("*.py"))
+    if not files:
+        print("No Python files found in the current directory.")
+        return
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def analyze(path: Path) -> str:
+        async with semaphore:
+            result = await agent.run(
+                f"Pythonファイル {path} の構造を分析し、"
+                "主要なクラスと関数を一覧してください。"
+            )
+        return result.output
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(analyze(path)) for path in files]
 
     print("=== Analysis Result ===")
-    print(result.output)
+    for path, task in zip(files, tasks, strict=True):
+        print(f"--- {path} ---")
+        print(task.result())
+        print()
 
 
 if __name__ == "__main__":
+    # except* unwraps the ExceptionGroup raised by asyncio.TaskGroup; several
+    # clauses can match one group, so the exit happens once after the try
+    failed = False
     try:
-        asyncio.run(main())
-    except CLINotFoundError as e:
-        print(f"CLI not found: {e}", file=sys.stderr)
-        sys.exit(1)
-    except CLIExecutionError as e:
-        print(f"CLI execution failed: {e}", file=sys.stderr)
-        sys.exit(1)
-    except CLIResponseParseError as e:
-        print(f"Failed to parse CLI response: {e}", file=sys.stderr)
+        run_main(main())
+    except* CLINotFoundError as eg:
+        print(f"CLI not found: {eg.exceptions[0]}", file=sys.stderr)
+        failed = True
+    except* CLIExecutionError as eg:
+        print(f"CLI execution failed: {eg.exceptions[0]}", file=sys.stderr)
+        failed = True
+    except* CLIResponseParseError as eg:
+        print(f"Failed to parse CLI response: {eg.exceptions[0]}", file=sys.stderr)
+        failed = True
+    if failed:
         sys.exit(1)
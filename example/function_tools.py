@@ -12,12 +12,65 @@ Usage:
     python example/function_tools.py
 """
 
+import ast
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from functools import lru_cache
+from types import CodeType, MappingProxyType
+
+from _batch import run_batch
+from _runner import run_main
 from pydantic_ai import Agent
 
 from claudecode_model import ClaudeCodeModel
 
+# Characters allowed in calculate() expressions; translate() with this table
+# deletes them, so any leftover character means the expression is rejected
+_ALLOWED_CALC_CHARS = frozenset("0123456789+-*/.() ")
+_CALC_DELETE_TABLE = str.maketrans("", "", "".join(_ALLOWED_CALC_CHARS))
+
+# AST node types permitted in calculate() expressions (no calls, names, or **)
+_ALLOWED_CALC_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+# Canned weather reports served by get_weather()
+_WEATHER: Mapping[str, str] = MappingProxyType(
+    {
+        "Tokyo": "Sunny, 22°C",
+        "New York": "Cloudy, 15°C",
+        "London": "Rainy, 12°C",
+        "Paris": "Partly cloudy, 18°C",
+    }
+)
+
+
+@lru_cache(maxsize=512)
+def _compile_expression(expression: str) -> CodeType:
+    """Parse, validate, and compile an arithmetic expression once per input.
+
+    Raises:
+        SyntaxError: If the expression is not valid Python syntax.
+        ValueError: If the expression contains anything but basic arithmetic.
+    """
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_CALC_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")  # noqa: TRY004
+    return compile(tree, "<calc>", "eval")
+
 
-def main() -> None:
+async def main() -> None:
     """Run the function tools example."""
     # Create model with bypassPermissions for non-interactive execution
     model = ClaudeCodeModel(
@@ -45,20 +98,14 @@ def main() -> None:
             Weather information for the specified city.
         """
         # In a real application, you would call a weather API here
-        weather_data = {
-            "Tokyo": "Sunny, 22°C",
-            "New York": "Cloudy, 15°C",
-            "London": "Rainy, 12°C",
-            "Paris": "Partly cloudy, 18°C",
-        }
-        return weather_data.get(city, f"Weather data not available for {city}")
+        return _WEATHER.get(city, f"Weather data not available for {city}")
 
     @agent.tool_plain
     def calculate(expression: str) -> str:
         """Calculate a mathematical expression.
 
-        WARNING: This demo uses eval() for simplicity.
-        In production, use a safe library like `simpleeval` or `asteval`.
+        The expression is parsed once, checked against a whitelist of
+        arithmetic AST nodes, and the compiled code object is cached.
 
         Args:
             expression: Mathematical expression to evaluate (e.g., "2 + 2", "15 * 7").
@@ -66,13 +113,12 @@ def main() -> None:
         Returns:
             The result of the calculation or an error message.
         """
-        # UNSAFE: demo only - use simpleeval/asteval in production
-        allowed_chars = set("0123456789+-*/.() ")
-        if not all(c in allowed_chars for c in expression):
+        if expression.translate(_CALC_DELETE_TABLE):
             return "Error: Only basic math operations are allowed"
 
         try:
-            result = eval(expression)  # noqa: S307
+            code = _compile_expression(expression)
+            result = eval(code, {"__builtins__": {}}, {})  # noqa: S307
             return f"{expression} = {result}"
         except (SyntaxError, ValueError, TypeError, ZeroDivisionError, NameError) as e:
             return f"Error calculating '{expression}': {type(e).__name__}: {e}"
@@ -90,11 +136,8 @@ def main() -> None:
         Returns:
             Current UTC time.
         """
-        from datetime import datetime, timezone as tz
-
         # Simplified: always returns UTC time
-        now = datetime.now(tz.utc)
-        return f"Current time (UTC): {now.strftime('%Y-%m-%d %H:%M:%S')} UTC"
+        return f"Current time (UTC): {datetime.now(UTC):%Y-%m-%d %H:%M:%S} UTC"
 
     # Register tools with the model's MCP server
     # This is required for Claude to be able to call the tools
@@ -104,17 +147,19 @@ def main() -> None:
     print("Running agent with function tools...")
     print("-" * 50)
 
-    prompt = """
-    I need some information:
-    1. What's the weather in Tokyo?
-    2. What's 25 * 4?
-    3. What time is it now?
-    """
+    # Independent questions are sent as separate prompts and run concurrently
+    prompts = [
+        "What's the weather in Tokyo?",
+        "What's 25 * 4?",
+        "What time is it now?",
+    ]
 
-    result = agent.run_sync(prompt)
+    results = await run_batch(agent, prompts)
 
-    print("Agent response:")
-    print(result.output)
+    for prompt, result in zip(prompts, results, strict=True):
+        print(f"Q: {prompt}")
+        print(f"A: {result.output}")
+        print()
 
 
 if __name__ == "__main__":
@@ -123,7 +168,7 @@ if __name__ == "__main__":
     from claudecode_model.exceptions import CLIExecutionError
 
     try:
-        main()
+        run_main(main())
     except CLIExecutionError as e:
         print(f"CLI execution failed: {e}", file=sys.stderr)
         sys.exit(1)
@@ -9,11 +9,11 @@ Prerequisites:
     - Valid authentication configured for Claude Code CLI
 """
 
-import asyncio
-import json
+import re
 import sys
 
-from pydantic import BaseModel, Field, ValidationError
+from _runner import run_main
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from pydantic_ai import Agent
 
 from claudecode_model import ClaudeCodeModel
@@ -23,6 +23,9 @@ from claudecode_model.exceptions import (
     CLIResponseParseError,
 )
 
+# Body of the first ``` or ```json fenced block in the response
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
 
 class CodeReview(BaseModel):
     """Code review result structure."""
@@ -33,6 +36,10 @@ class CodeReview(BaseModel):
     score: int = Field(ge=1, le=10)
 
 
+# Built once at import; validates raw JSON text in a single parse+validate pass
+_REVIEW_ADAPTER = TypeAdapter(CodeReview)
+
+
 async def main() -> None:
     """Run an agent that returns structured output via JSON."""
     model = ClaudeCodeModel(
@@ -69,25 +76,12 @@ def calc(x,y):
     print()
 
     # JSONブロックを抽出（```json ... ``` または直接JSON）
-    json_str = raw_output.strip()
-    if json_str.startswith("```"):
-        # コードブロックからJSONを抽出
-        lines = json_str.split("\n")
-        json_lines = []
-        in_json = False
-        for line in lines:
-            if line.startswith("```json"):
-                in_json = True
-                continue
-            if line.startswith("```") and in_json:
-                break
-            if in_json:
-                json_lines.append(line)
-        json_str = "\n".join(json_lines)
+    # validate_json accepts surrounding whitespace, so no stripped copy is needed
+    match = _FENCE_RE.search(raw_output)
+    json_str = match.group(1) if match else raw_output
 
     try:
-        data = json.loads(json_str)
-        review = CodeReview.model_validate(data)
+        review = _REVIEW_ADAPTER.validate_json(json_str)
 
         print("=== Parsed Code Review ===")
         print(f"File: {review.file_name}")
@@ -100,18 +94,16 @@ def calc(x,y):
         print("Suggestions:")
         for suggestion in review.suggestions:
             print(f"  - {suggestion}")
-    except json.JSONDecodeError as e:
-        print(f"Failed to parse JSON: {e}", file=sys.stderr)
-        print(f"Raw output was: {raw_output}", file=sys.stderr)
-        sys.exit(1)
     except ValidationError as e:
-        print(f"Validation failed: {e}", file=sys.stderr)
+        # Covers both malformed JSON (json_invalid) and schema violations
+        print(f"Failed to parse or validate JSON: {e}", file=sys.stderr)
+        print(f"Raw output was: {raw_output}", file=sys.stderr)
         sys.exit(1)
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_main(main())
     except CLINotFoundError as e:
         print(f"CLI not found: {e}", file=sys.stderr)
         sys.exit(1)
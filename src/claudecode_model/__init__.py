@@ -1,26 +1,35 @@
 """claudecode-model: pydantic-ai Model implementation for Claude Code CLI."""
 
+import importlib
 import logging
 import os
 import warnings
+from typing import TYPE_CHECKING
 
 # Configure log level from environment variable
 # Users can set CLAUDECODE_MODEL_LOG_LEVEL to DEBUG, INFO, WARNING, ERROR, or CRITICAL
 # Default is WARNING (suppresses debug/info logs)
-_VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+_VALID_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 _log_level_env = os.getenv("CLAUDECODE_MODEL_LOG_LEVEL")
 _log_level_str = (_log_level_env or "WARNING").upper()
+_log_level = _VALID_LOG_LEVELS.get(_log_level_str)
 
-if _log_level_str not in _VALID_LOG_LEVELS:
+if _log_level is None:
     warnings.warn(
         f"Invalid CLAUDECODE_MODEL_LOG_LEVEL='{_log_level_str}'. "
         f"Valid values: DEBUG, INFO, WARNING, ERROR, CRITICAL. Using WARNING.",
         stacklevel=1,
     )
-    _log_level_str = "WARNING"
+    _log_level = logging.WARNING
 
 _logger = logging.getLogger("claudecode_model")
-_logger.setLevel(getattr(logging, _log_level_str))
+_logger.setLevel(_log_level)
 
 # Add handler only when env var is explicitly set and no handler exists yet
 # (prevents duplicate handlers on module reload)
@@ -31,75 +40,141 @@ if _log_level_env is not None and not _logger.handlers:
     )
     _logger.addHandler(_handler)
 
-from claudecode_model.cli import (  # noqa: E402
-    DEFAULT_MODEL,
-    DEFAULT_TIMEOUT_SECONDS,
-    MAX_PROMPT_LENGTH,
-    ClaudeCodeCLI,
-)
-from claudecode_model.deps_support import (  # noqa: E402
-    DepsBearer,
-    DepsContext,
-    ToolCallContext,
-    create_deps_context,
-    deserialize_deps,
-    is_instance_serializable,
-    is_serializable_type,
-    serialize_deps,
-)
-from claudecode_model.exceptions import (  # noqa: E402
-    BridgeStartupError,
-    CLIExecutionError,
-    CLIInterruptedError,
-    CLINotFoundError,
-    CLIResponseParseError,
-    ClaudeCodeError,
-    ErrorType,
-    IPCConnectionError,
-    IPCError,
-    IPCMessageSizeError,
-    IPCToolExecutionError,
-    MissingDepsError,
-    StructuredOutputError,
-    ToolNotFoundError,
-    ToolsetNotRegisteredError,
-    TypeHintResolutionError,
-    UnsupportedDepsTypeError,
-)
-from claudecode_model.ipc import DEFAULT_TRANSPORT, TransportType  # noqa: E402
-from claudecode_model.json_utils import extract_json  # noqa: E402
-from claudecode_model.model import ClaudeCodeModel  # noqa: E402
-from claudecode_model.response_converter import (  # noqa: E402
-    convert_sdk_messages_to_cli_response,
-    convert_usage_dict_to_cli_usage,
-    extract_text_from_assistant_message,
-)
-from claudecode_model.tool_converter import (  # noqa: E402
-    JsonSchema,
-    McpResponse,
-    McpServerConfig,
-    McpTextContent,
-    convert_mixed_tools_to_mcp_server,
-    convert_tool,
-    convert_tool_with_context,
-    convert_tool_with_deps,
-    convert_tools_to_mcp_server,
-    create_async_handler,
-)
-from claudecode_model.types import (  # noqa: E402
-    AsyncMessageCallback,
-    CacheCreation,
-    CLIResponse,
-    CLIResponseData,
-    CLIUsage,
-    CLIUsageData,
-    ClaudeCodeModelSettings,
-    MessageCallback,
-    MessageCallbackType,
-    ModelUsageData,
-    RequestWithMetadataResult,
-    ServerToolUse,
-)
+if TYPE_CHECKING:
+    from claudecode_model.cli import (
+        DEFAULT_MODEL,
+        DEFAULT_TIMEOUT_SECONDS,
+        MAX_PROMPT_LENGTH,
+        ClaudeCodeCLI,
+    )
+    from claudecode_model.deps_support import (
+        DepsBearer,
+        DepsContext,
+        ToolCallContext,
+        create_deps_context,
+        deserialize_deps,
+        is_instance_serializable,
+        is_serializable_type,
+        serialize_deps,
+        serialize_deps_bytes,
+    )
+    from claudecode_model.exceptions import (
+        BridgeStartupError,
+        CLIExecutionError,
+        CLIInterruptedError,
+        CLINotFoundError,
+        CLIResponseParseError,
+        ClaudeCodeError,
+        ErrorType,
+        IPCConnectionError,
+        IPCError,
+        IPCMessageSizeError,
+        IPCToolExecutionError,
+        MissingDepsError,
+        StructuredOutputError,
+        ToolNotFoundError,
+        ToolsetNotRegisteredError,
+        TypeHintResolutionError,
+        UnsupportedDepsTypeError,
+    )
+    from claudecode_model.ipc import DEFAULT_TRANSPORT, TransportType
+    from claudecode_model.json_utils import extract_json
+    from claudecode_model.model import ClaudeCodeModel
+    from claudecode_model.response_converter import (
+        convert_sdk_messages_to_cli_response,
+        convert_usage_dict_to_cli_usage,
+        extract_text_from_assistant_message,
+    )
+    from claudecode_model.tool_converter import (
+        JsonSchema,
+        McpResponse,
+        McpServerConfig,
+        McpTextContent,
+        convert_mixed_tools_to_mcp_server,
+        convert_tool,
+        convert_tool_with_context,
+        convert_tool_with_deps,
+        convert_tools_to_mcp_server,
+        create_async_handler,
+    )
+    from claudecode_model.types import (
+        AsyncMessageCallback,
+        CacheCreation,
+        CLIResponse,
+        CLIResponseData,
+        CLIUsage,
+        CLIUsageData,
+        ClaudeCodeModelSettings,
+        MessageCallback,
+        MessageCallbackType,
+        ModelUsageData,
+        RequestWithMetadataResult,
+        ServerToolUse,
+    )
+
+# Public name -> defining submodule; each submodule (and its SDK / pydantic-ai
+# import chain) is only imported when one of its names is first accessed
+_LAZY_IMPORTS: dict[str, str] = {
+    "DEFAULT_MODEL": "claudecode_model.cli",
+    "DEFAULT_TIMEOUT_SECONDS": "claudecode_model.cli",
+    "MAX_PROMPT_LENGTH": "claudecode_model.cli",
+    "ClaudeCodeCLI": "claudecode_model.cli",
+    "DepsBearer": "claudecode_model.deps_support",
+    "DepsContext": "claudecode_model.deps_support",
+    "ToolCallContext": "claudecode_model.deps_support",
+    "create_deps_context": "claudecode_model.deps_support",
+    "deserialize_deps": "claudecode_model.deps_support",
+    "is_instance_serializable": "claudecode_model.deps_support",
+    "is_serializable_type": "claudecode_model.deps_support",
+    "serialize_deps": "claudecode_model.deps_support",
+    "serialize_deps_bytes": "claudecode_model.deps_support",
+    "BridgeStartupError": "claudecode_model.exceptions",
+    "CLIExecutionError": "claudecode_model.exceptions",
+    "CLIInterruptedError": "claudecode_model.exceptions",
+    "CLINotFoundError": "claudecode_model.exceptions",
+    "CLIResponseParseError": "claudecode_model.exceptions",
+    "ClaudeCodeError": "claudecode_model.exceptions",
+    "ErrorType": "claudecode_model.exceptions",
+    "IPCConnectionError": "claudecode_model.exceptions",
+    "IPCError": "claudecode_model.exceptions",
+    "IPCMessageSizeError": "claudecode_model.exceptions",
+    "IPCToolExecutionError": "claudecode_model.exceptions",
+    "MissingDepsError": "claudecode_model.exceptions",
+    "StructuredOutputError": "claudecode_model.exceptions",
+    "ToolNotFoundError": "claudecode_model.exceptions",
+    "ToolsetNotRegisteredError": "claudecode_model.exceptions",
+    "TypeHintResolutionError": "claudecode_model.exceptions",
+    "UnsupportedDepsTypeError": "claudecode_model.exceptions",
+    "DEFAULT_TRANSPORT": "claudecode_model.ipc",
+    "TransportType": "claudecode_model.ipc",
+    "extract_json": "claudecode_model.json_utils",
+    "ClaudeCodeModel": "claudecode_model.model",
+    "convert_sdk_messages_to_cli_response": "claudecode_model.response_converter",
+    "convert_usage_dict_to_cli_usage": "claudecode_model.response_converter",
+    "extract_text_from_assistant_message": "claudecode_model.response_converter",
+    "JsonSchema": "claudecode_model.tool_converter",
+    "McpResponse": "claudecode_model.tool_converter",
+    "McpServerConfig": "claudecode_model.tool_converter",
+    "McpTextContent": "claudecode_model.tool_converter",
+    "convert_mixed_tools_to_mcp_server": "claudecode_model.tool_converter",
+    "convert_tool": "claudecode_model.tool_converter",
+    "convert_tool_with_context": "claudecode_model.tool_converter",
+    "convert_tool_with_deps": "claudecode_model.tool_converter",
+    "convert_tools_to_mcp_server": "claudecode_model.tool_converter",
+    "create_async_handler": "claudecode_model.tool_converter",
+    "AsyncMessageCallback": "claudecode_model.types",
+    "CacheCreation": "claudecode_model.types",
+    "CLIResponse": "claudecode_model.types",
+    "CLIResponseData": "claudecode_model.types",
+    "CLIUsage": "claudecode_model.types",
+    "CLIUsageData": "claudecode_model.types",
+    "ClaudeCodeModelSettings": "claudecode_model.types",
+    "MessageCallback": "claudecode_model.types",
+    "MessageCallbackType": "claudecode_model.types",
+    "ModelUsageData": "claudecode_model.types",
+    "RequestWithMetadataResult": "claudecode_model.types",
+    "ServerToolUse": "claudecode_model.types",
+}
 
 __all__ = [
     "ClaudeCodeModel",
@@ -162,9 +237,46 @@ __all__ = [
     "is_serializable_type",
     "is_instance_serializable",
     "serialize_deps",
+    "serialize_deps_bytes",
     "deserialize_deps",
 ]
 
+# Public submodules reachable as package attributes (claudecode_model.model),
+# which the former eager imports bound as a side effect
+_SUBMODULES: frozenset[str] = frozenset(
+    {
+        "cli",
+        "deps_support",
+        "exceptions",
+        "ipc",
+        "json_utils",
+        "mcp_integration",
+        "model",
+        "response_converter",
+        "tool_converter",
+        "types",
+    }
+)
+
+
+def __getattr__(name: str) -> object:
+    """Import the submodule defining *name* on first access (PEP 562)."""
+    if name in _SUBMODULES:
+        # import_module also binds the submodule in the package namespace
+        return importlib.import_module(f"{__name__}.{name}")
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache in the module namespace so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 def main() -> None:
     """Entry point for the CLI (placeholder)."""
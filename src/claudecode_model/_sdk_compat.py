@@ -43,11 +43,20 @@ logger = logging.getLogger(__name__)
 # exception will be re-raised — i.e. the code fails safe, not silent.
 _UNKNOWN_TYPE_PREFIX = "Unknown message type: "
 
+# Message types the SDK has already rejected as unknown. Later messages of the
+# same type are skipped without calling the SDK parser, so rate-limit-heavy
+# streams do not pay for a raised-and-caught exception per message. Types are
+# learned from the SDK's own errors rather than hard-coded, so types added in
+# newer SDK versions are still parsed.
+_skipped_message_types: set[str] = set()
+
 
 def _safe_parse_message(data: dict[str, object]) -> Message | None:
     """Wrapper around SDK's parse_message that returns None for unknown types.
 
-    For unknown message types, logs a warning and returns None.
+    For unknown message types, logs a warning and returns None. Once a type
+    has been rejected by the SDK, later messages of that type are skipped
+    before calling the SDK parser.
     For all other MessageParseError cases (missing fields, invalid data),
     re-raises the exception to preserve existing error handling.
 
@@ -65,13 +74,25 @@ def _safe_parse_message(data: dict[str, object]) -> Message | None:
     Raises:
         MessageParseError: If parsing fails for reasons other than unknown type.
     """
+    # Non-dict input is left to the SDK parser, which raises MessageParseError
+    message_type = data.get("type") if isinstance(data, dict) else None
+    if isinstance(message_type, str) and message_type in _skipped_message_types:
+        logger.warning(
+            "Skipping unrecognized SDK message type: type=%s, data=%r",
+            message_type,
+            data,
+        )
+        return None
+
     try:
         return _original_parse_message(data)
     except MessageParseError as e:
         if str(e).startswith(_UNKNOWN_TYPE_PREFIX):
+            if isinstance(message_type, str):
+                _skipped_message_types.add(message_type)
             logger.warning(
                 "Skipping unrecognized SDK message type: type=%s, data=%r",
-                data.get("type") if isinstance(data, dict) else type(data).__name__,
+                message_type,
                 data,
             )
             return None
@@ -7,6 +7,9 @@ import json
 import logging
 import shutil
 from collections.abc import Callable
+from functools import lru_cache
+
+from pydantic_core import from_json
 
 from claudecode_model.exceptions import (
     CLIExecutionError,
@@ -32,8 +35,35 @@ TIMEOUT_EXIT_CODE = -9  # Exit code for timeout signal (SIGKILL)
 GRACEFUL_TERMINATION_TIMEOUT_SECONDS = 5.0  # Wait time for SIGTERM before SIGKILL
 
 
+@lru_cache(maxsize=1)
+def _resolve_claude_cli() -> str:
+    """Find the claude CLI executable on PATH.
+
+    The PATH scan runs once per process and is shared by all ClaudeCodeCLI
+    instances; a failed lookup is not cached, so a later call retries.
+    ``_resolve_claude_cli.cache_clear()`` forces a fresh lookup.
+
+    Raises:
+        CLINotFoundError: If claude is not found on PATH.
+    """
+    cli_path = shutil.which("claude")
+    if cli_path is None:
+        raise CLINotFoundError(
+            "claude CLI not found. "
+            "Please install Claude Code: https://claude.ai/download"
+        )
+    return cli_path
+
+
 class ClaudeCodeCLI:
-    """Execute Claude Code CLI as subprocess."""
+    """Execute Claude Code CLI as subprocess.
+
+    Each ``execute()`` call runs ``claude -p --output-format json`` once and
+    waits for it to exit: print mode answers a single prompt per process, so
+    there is no long-lived process that could be pooled and reused across
+    calls. Run independent prompts concurrently instead to overlap the
+    process start-up cost.
+    """
 
     def __init__(
         self,
@@ -79,12 +109,7 @@ class ClaudeCodeCLI:
         if self._cli_path is not None:
             return self._cli_path
 
-        cli_path = shutil.which("claude")
-        if cli_path is None:
-            raise CLINotFoundError(
-                "claude CLI not found. "
-                "Please install Claude Code: https://claude.ai/download"
-            )
+        cli_path = _resolve_claude_cli()
         self._cli_path = cli_path
         return cli_path
 
@@ -100,7 +125,7 @@ class ClaudeCodeCLI:
         Raises:
             ValueError: If prompt is empty or exceeds maximum length.
         """
-        if not prompt or not prompt.strip():
+        if not prompt or prompt.isspace():
             raise ValueError("Prompt cannot be empty")
 
         if len(prompt) > MAX_PROMPT_LENGTH:
@@ -281,16 +306,14 @@ class ClaudeCodeCLI:
                 recoverable=False,
             ) from e
 
-        try:
-            stdout_str = stdout.decode("utf-8")
-            stderr_str = stderr.decode("utf-8")
-        except UnicodeDecodeError as e:
-            raise CLIResponseParseError(
-                f"Failed to decode CLI output as UTF-8: {e}",
-                raw_output=repr(stdout[:500]),
-            ) from e
-
         if process.returncode != 0:
+            try:
+                stderr_str = stderr.decode("utf-8")
+            except UnicodeDecodeError as e:
+                raise CLIResponseParseError(
+                    f"Failed to decode CLI output as UTF-8: {e}",
+                    raw_output=repr(stderr[:500]),
+                ) from e
             raise CLIExecutionError(
                 f"CLI exited with code {process.returncode}",
                 exit_code=process.returncode,
@@ -299,9 +322,18 @@ class ClaudeCodeCLI:
                 recoverable=False,
             )
 
+        # Parse the raw bytes directly; decoding to str is only needed to
+        # report a failure
         try:
-            data: CLIResponseData = json.loads(stdout_str)
-        except json.JSONDecodeError as e:
+            data: CLIResponseData = from_json(stdout)
+        except ValueError as e:
+            try:
+                stdout_str = stdout.decode("utf-8")
+            except UnicodeDecodeError as decode_error:
+                raise CLIResponseParseError(
+                    f"Failed to decode CLI output as UTF-8: {decode_error}",
+                    raw_output=repr(stdout[:500]),
+                ) from decode_error
             raise CLIResponseParseError(
                 f"Failed to parse CLI JSON output: {e}",
                 raw_output=stdout_str,
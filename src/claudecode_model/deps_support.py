@@ -20,7 +20,9 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import asdict, fields, is_dataclass
+from collections.abc import Callable
+from dataclasses import fields, is_dataclass
+from functools import lru_cache, partial
 from types import UnionType
 from typing import (
     Protocol,
@@ -31,8 +33,8 @@ from typing import (
     runtime_checkable,
 )
 
-from dacite import from_dict
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError, to_json
 
 from claudecode_model.exceptions import (
     TypeHintResolutionError,
@@ -44,6 +46,29 @@ logger = logging.getLogger(__name__)
 # Primitive types that are directly JSON serializable
 _PRIMITIVE_TYPES: tuple[type, ...] = (str, int, float, bool, type(None))
 
+# Collection origins whose generic args (list[T], dict[K, V]) are checked
+_COLLECTION_TYPES: frozenset[type] = frozenset((dict, list))
+
+# Bare (unparameterized) types that are serializable without any introspection
+_BARE_SERIALIZABLE_TYPES: frozenset[type] = (
+    frozenset(_PRIMITIVE_TYPES) | _COLLECTION_TYPES
+)
+
+# Base classes whose instances pydantic-core encodes as plain JSON values
+_JSON_NATIVE_INSTANCE_TYPES: tuple[type, ...] = (*_PRIMITIVE_TYPES, dict, list)
+
+# Base classes whose instances (including subclass instances) are serializable
+_SERIALIZABLE_INSTANCE_TYPES: tuple[type, ...] = (
+    *_JSON_NATIVE_INSTANCE_TYPES,
+    BaseModel,
+)
+
+# Upper bound on memoized is_serializable_type results
+_SERIALIZABLE_TYPE_CACHE_SIZE = 1024
+
+# Upper bound on cached per-type decoders used by deserialize_deps
+_DECODER_CACHE_SIZE = 256
+
 
 def is_serializable_type(deps_type: type | object) -> bool:
     """Check if a dependency type is serializable.
@@ -51,6 +76,10 @@ def is_serializable_type(deps_type: type | object) -> bool:
     Supports both simple types and generic types like list[str], dict[str, int],
     and Optional[str] (str | None).
 
+    The result is a pure function of the type, so it is memoized per
+    hashable type. Unhashable types (e.g. ``Annotated`` with dict metadata)
+    are checked without the cache.
+
     Args:
         deps_type: The type to check for serializability.
 
@@ -73,6 +102,33 @@ def is_serializable_type(deps_type: type | object) -> bool:
         >>> is_serializable_type(Config)
         True
     """
+    # lru_cache hashes its argument, so unhashable types are checked uncached
+    try:
+        hash(deps_type)
+    except TypeError:
+        return _check_serializable_type(deps_type)
+    return _is_serializable_type_cached(deps_type)
+
+
+@lru_cache(maxsize=_SERIALIZABLE_TYPE_CACHE_SIZE)
+def _is_serializable_type_cached(deps_type: type | object) -> bool:
+    """Memoized :func:`_check_serializable_type` for hashable types."""
+    return _check_serializable_type(deps_type)
+
+
+def _check_serializable_type(deps_type: type | object) -> bool:
+    """Check serializability of *deps_type* without memoization.
+
+    Args:
+        deps_type: The type to check for serializability.
+
+    Returns:
+        True if the type is serializable, False otherwise.
+    """
+    # Fast path: primitives and bare dict/list need no introspection
+    if isinstance(deps_type, type) and deps_type in _BARE_SERIALIZABLE_TYPES:
+        return True
+
     # Handle generic types (list[str], dict[str, int], etc.)
     origin = get_origin(deps_type)
     if origin is not None:
@@ -82,20 +138,12 @@ def is_serializable_type(deps_type: type | object) -> bool:
             return all(is_serializable_type(arg) for arg in args)
 
         # For list[T] and dict[K, V], check the origin and args
-        if origin in (list, dict):
+        if origin in _COLLECTION_TYPES:
             args = get_args(deps_type)
             return all(is_serializable_type(arg) for arg in args)
 
         return False
 
-    # Check primitive types
-    if deps_type in _PRIMITIVE_TYPES:
-        return True
-
-    # Check dict and list (without type parameters)
-    if deps_type in (dict, list):
-        return True
-
     # Check dataclass
     if is_dataclass(deps_type) and isinstance(deps_type, type):
         return _is_dataclass_serializable(deps_type)
@@ -149,6 +197,12 @@ def _is_dataclass_serializable(dc_type: type) -> bool:
 def serialize_deps(deps: object) -> str:
     """Serialize dependencies to JSON string.
 
+    Encoding is done by pydantic-core's native JSON serializer, which emits
+    compact JSON (no whitespace after separators) with non-ASCII characters
+    left unescaped. Values that pydantic-core knows how to encode, such as
+    ``datetime``, ``date``, ``bytes`` and ``set``, are accepted inside dicts,
+    lists and dataclasses.
+
     Args:
         deps: The dependency object to serialize.
 
@@ -157,31 +211,71 @@ def serialize_deps(deps: object) -> str:
 
     Raises:
         UnsupportedDepsTypeError: If the dependency type is not serializable.
+        TypeError: If a dict, list or dataclass contains a value that cannot
+            be encoded as JSON.
 
     Examples:
         >>> serialize_deps({"key": "value"})
-        '{"key": "value"}'
+        '{"key":"value"}'
         >>> from dataclasses import dataclass
         >>> @dataclass
         ... class Config:
         ...     value: int
         >>> serialize_deps(Config(value=42))
-        '{"value": 42}'
+        '{"value":42}'
+    """
+    return serialize_deps_bytes(deps).decode()
+
+
+def serialize_deps_bytes(deps: object) -> bytes:
+    """Serialize dependencies to UTF-8 encoded JSON bytes.
+
+    Same output as ``serialize_deps`` without the final decode to ``str``,
+    for callers that write straight to a socket or file.
+
+    Args:
+        deps: The dependency object to serialize.
+
+    Returns:
+        UTF-8 encoded JSON representation of the dependencies.
+
+    Raises:
+        UnsupportedDepsTypeError: If the dependency type is not serializable.
+        TypeError: If a dict, list or dataclass contains a value that cannot
+            be encoded as JSON.
+
+    Examples:
+        >>> serialize_deps_bytes({"key": "value"})
+        b'{"key":"value"}'
     """
-    # Check if type is serializable
-    deps_type = type(deps)
-    if not is_instance_serializable(deps):
-        raise UnsupportedDepsTypeError(deps_type.__name__)
+    # Validation and dispatch in one pass: each type probe runs at most once.
+    # Plain dicts, lists and primitives are the common case, so they go first
+    if isinstance(deps, _JSON_NATIVE_INSTANCE_TYPES):
+        return _encode_json(deps)
 
-    # Serialize based on type
     if isinstance(deps, BaseModel):
-        return deps.model_dump_json()
+        # The serializer behind model_dump_json(), minus its decode to str
+        return deps.__pydantic_serializer__.to_json(deps)
 
     if is_dataclass(deps) and not isinstance(deps, type):
-        return json.dumps(asdict(deps))
+        # pydantic-core walks dataclass fields (including nested dataclasses)
+        # itself, so no asdict() deep copy
+        return _encode_json(deps)
 
-    # Primitives and collections
-    return json.dumps(deps)
+    raise UnsupportedDepsTypeError(type(deps).__name__)
+
+
+def _encode_json(deps: object) -> bytes:
+    """Encode a plain or dataclass value with pydantic-core.
+
+    Raises:
+        TypeError: If a contained value cannot be encoded, as ``json.dumps``
+            raised for these values before pydantic-core was used.
+    """
+    try:
+        return to_json(deps)
+    except PydanticSerializationError as exc:
+        raise TypeError(str(exc)) from exc
 
 
 def is_instance_serializable(obj: object) -> bool:
@@ -193,34 +287,34 @@ def is_instance_serializable(obj: object) -> bool:
     Returns:
         True if the instance is serializable.
     """
-    if obj is None:
+    # Fast path: exact primitive / dict / list instances (the common case)
+    if type(obj) in _BARE_SERIALIZABLE_TYPES:
         return True
 
-    if isinstance(obj, _PRIMITIVE_TYPES):
+    # Subclasses of primitives and collections, and Pydantic models
+    if isinstance(obj, _SERIALIZABLE_INSTANCE_TYPES):
         return True
 
-    if isinstance(obj, dict | list):
-        return True
+    return is_dataclass(obj) and not isinstance(obj, type)
 
-    if isinstance(obj, BaseModel):
-        return True
 
-    if is_dataclass(obj) and not isinstance(obj, type):
-        return True
-
-    return False
-
-
-def deserialize_deps[T](json_str: str, deps_type: type[T]) -> T:
+def deserialize_deps[T](json_str: str | bytes, deps_type: type[T]) -> T:
     """Deserialize JSON string to dependency object.
 
     Args:
-        json_str: JSON string to deserialize.
+        json_str: JSON to deserialize, as ``str`` or UTF-8 encoded ``bytes``
+            (bytes are parsed directly, with no intermediate ``str``).
         deps_type: The target type to deserialize to.
 
     Returns:
         Deserialized dependency object of the specified type.
 
+    Raises:
+        json.JSONDecodeError: If json_str is not valid JSON (dict, list and
+            primitive types).
+        pydantic.ValidationError: If deps_type is a BaseModel or dataclass and
+            json_str is not valid JSON or does not match its fields.
+
     Examples:
         >>> deserialize_deps('{"key": "value"}', dict)
         {'key': 'value'}
@@ -231,19 +325,32 @@ def deserialize_deps[T](json_str: str, deps_type: type[T]) -> T:
         >>> deserialize_deps('{"value": 42}', Config)
         Config(value=42)
     """
-    # Parse JSON first
-    data = json.loads(json_str)
+    # The dispatch on deps_type is resolved once per type and cached
+    return _deps_decoder(deps_type)(json_str)  # type: ignore[arg-type, return-value]
+
 
-    # Handle Pydantic BaseModel
+@lru_cache(maxsize=_DECODER_CACHE_SIZE)
+def _deps_decoder(deps_type: type) -> Callable[[str | bytes], object]:
+    """Select the JSON decoder for a deps type.
+
+    Args:
+        deps_type: The target type to deserialize to.
+
+    Returns:
+        A callable that parses JSON ``str`` or ``bytes`` into ``deps_type``.
+    """
+    # Pydantic BaseModel: the class's compiled validator parses and
+    # validates the raw JSON in one pass, with no intermediate dict
     if isinstance(deps_type, type) and issubclass(deps_type, BaseModel):
-        return deps_type.model_validate(data)  # type: ignore[return-value]
+        return deps_type.model_validate_json
 
-    # Handle dataclass - use dacite for recursive deserialization
+    # Dataclass: strict validation (no type coercion), nested dataclasses
+    # included, straight from the raw JSON. The TypeAdapter is built once
     if is_dataclass(deps_type) and isinstance(deps_type, type):
-        return from_dict(data_class=deps_type, data=data)  # type: ignore[return-value]
+        return partial(TypeAdapter(deps_type).validate_json, strict=True)
 
-    # Handle primitives and collections - just return parsed data
-    return data  # type: ignore[return-value]
+    # Primitives and collections: just return parsed data
+    return json.loads
 
 
 class DepsContext[T]:
@@ -272,6 +379,8 @@ class DepsContext[T]:
         'secret'
     """
 
+    __slots__ = ("_deps",)
+
     def __init__(self, deps: T) -> None:
         """Initialize the context with dependencies.
 
@@ -322,6 +431,8 @@ class ToolCallContext[T]:
         deps: The dependency object (any type).
     """
 
+    __slots__ = ("_deps",)
+
     def __init__(self, deps: T) -> None:
         self._deps = deps
 
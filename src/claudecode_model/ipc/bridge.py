@@ -14,6 +14,7 @@ Usage::
 """
 
 import asyncio
+import itertools
 import json
 import logging
 import sys
@@ -88,6 +89,10 @@ class IPCClient:
     Uses lazy connection: the Unix socket connection is established on the first
     ``call_tool`` invocation and reused for subsequent calls.
 
+    Requests are pipelined: each carries a per-connection ``id``, and a reader
+    task routes responses back to the waiting ``call_tool`` by that id, so
+    concurrent tool calls share the socket without waiting for each other.
+
     Args:
         socket_path: Path to the Unix domain socket.
     """
@@ -97,6 +102,10 @@ class IPCClient:
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._connected: bool = False
+        self._connect_lock = asyncio.Lock()
+        self._request_ids = itertools.count()
+        self._pending: dict[int, asyncio.Future[dict[str, object]]] = {}
+        self._reader_task: asyncio.Task[None] | None = None
 
     async def _connect(self) -> None:
         """Establish connection to the IPC server.
@@ -133,18 +142,30 @@ class IPCClient:
                 communication fails.
         """
         if not self._connected:
-            await self._connect()
+            async with self._connect_lock:
+                if not self._connected:
+                    await self._connect()
 
-        assert self._reader is not None  # noqa: S101
         assert self._writer is not None  # noqa: S101
 
+        request_id = next(self._request_ids)
         request: IPCRequest = {
+            "id": request_id,
             "method": "call_tool",
             "params": {"name": name, "arguments": arguments},
         }
 
-        await send_message(self._writer, request)
-        raw_response = await receive_message(self._reader)
+        response_future: asyncio.Future[dict[str, object]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending[request_id] = response_future
+        try:
+            await send_message(self._writer, request)
+            if self._reader_task is None or self._reader_task.done():
+                self._reader_task = asyncio.create_task(self._read_responses())
+            raw_response = await response_future
+        finally:
+            self._pending.pop(request_id, None)
 
         # Check for error response
         if "error" in raw_response:
@@ -164,8 +185,66 @@ class IPCClient:
         assert isinstance(result, dict)  # noqa: S101
         return result  # type: ignore[return-value]
 
+    async def _read_responses(self) -> None:
+        """Route responses to pending ``call_tool`` futures by request id.
+
+        Runs while requests are pending and exits once none are left, so no
+        read is outstanding between calls.  Any failure, including a frame
+        that is not an object with an integer ``id``, is delivered to every
+        pending request so that no caller waits forever.
+        """
+        assert self._reader is not None  # noqa: S101
+        try:
+            while self._pending:
+                raw_response = await receive_message(self._reader)
+                request_id = (
+                    raw_response.get("id") if isinstance(raw_response, dict) else None
+                )
+                if not isinstance(request_id, int):
+                    # Without an id the response cannot be routed to its caller
+                    raise IPCError(
+                        "Invalid IPC response: expected an object with an "
+                        f"integer 'id', got {type(raw_response).__name__}"
+                    )
+                response_future = self._pending.pop(request_id, None)
+                if response_future is None:
+                    # The caller gave up (cancelled) before its response arrived
+                    logger.warning(
+                        "Dropping IPC response for unknown id %d", request_id
+                    )
+                    continue
+                if not response_future.done():
+                    response_future.set_result(raw_response)
+        except asyncio.CancelledError:
+            self._fail_pending(IPCError("IPC connection closed"))
+            raise
+        except (IPCError, OSError) as exc:
+            # OSError covers ConnectionError raised by the stream reader
+            self._fail_pending(exc)
+        finally:
+            # An unexpected error propagates from the task unchanged; the
+            # callers still must not wait forever on their responses
+            self._fail_pending(IPCError("IPC response reader stopped"))
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        """Fail every pending ``call_tool`` with *exc*."""
+        for response_future in self._pending.values():
+            if not response_future.done():
+                response_future.set_exception(exc)
+
     async def close(self) -> None:
         """Close the IPC connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                # The pending calls were already failed by the reader task
+                logger.exception("IPC response reader failed")
+            self._reader_task = None
+        self._fail_pending(IPCError("IPC connection closed"))
         if self._writer is not None:
             self._writer.close()
             try:
@@ -208,8 +287,10 @@ def create_bridge_server(
         result = await ipc_client.call_tool(name, arguments or {})
         content_list = result.get("content", [])
         assert isinstance(content_list, list)  # noqa: S101
+        # The content comes from our own ToolResult contract and the text is
+        # coerced to str here, so per-block pydantic validation is skipped
         return [
-            TextContent(type="text", text=str(item.get("text", "")))
+            TextContent.model_construct(type="text", text=str(item.get("text", "")))
             for item in content_list
             if isinstance(item, dict)
         ]
@@ -258,4 +339,10 @@ if __name__ == "__main__":
         )
         sys.exit(1)
 
-    asyncio.run(_run_bridge(sys.argv[1], sys.argv[2]))
+    # Use uvloop's libuv-based event loop when installed (faster socket I/O)
+    try:
+        from uvloop import run as run_bridge  # type: ignore[import-not-found]
+    except ImportError:
+        run_bridge = asyncio.run
+
+    run_bridge(_run_bridge(sys.argv[1], sys.argv[2]))
@@ -10,10 +10,11 @@ Wire format::
 """
 
 import asyncio
-import json
 import struct
 from collections.abc import Mapping
-from typing import TypedDict
+from typing import NotRequired, TypedDict
+
+from pydantic_core import from_json, to_json
 
 from claudecode_model.exceptions import IPCError, IPCMessageSizeError
 
@@ -25,6 +26,9 @@ MAX_MESSAGE_SIZE: int = 10_485_760
 LENGTH_PREFIX_SIZE: int = 4
 """Byte count for the message length prefix (big-endian uint32)."""
 
+_LENGTH_PREFIX = struct.Struct("!I")
+"""Precompiled codec for the length prefix (format parsed once, not per message)."""
+
 SOCKET_PERMISSIONS: int = 0o600
 """Unix permission bits for socket files (owner read/write only)."""
 
@@ -49,8 +53,13 @@ class CallToolParams(TypedDict):
 
 
 class IPCRequest(TypedDict):
-    """Request message from bridge to parent (call_tool only)."""
+    """Request message from bridge to parent (call_tool only).
+
+    ``id`` is unique per connection and is echoed back in the response, so
+    several requests can be in flight on one socket.
+    """
 
+    id: int
     method: str
     params: CallToolParams
 
@@ -78,6 +87,7 @@ class ToolResult(_ToolResultRequired, total=False):
 class IPCResponse(TypedDict):
     """Success response from parent to bridge."""
 
+    id: NotRequired[int]
     result: ToolResult
 
 
@@ -91,6 +101,7 @@ class IPCErrorPayload(TypedDict):
 class IPCErrorResponse(TypedDict):
     """Error response from parent to bridge."""
 
+    id: NotRequired[int]
     error: IPCErrorPayload
 
 
@@ -118,14 +129,17 @@ async def send_message(
     Raises:
         IPCMessageSizeError: If the encoded payload exceeds ``MAX_MESSAGE_SIZE``.
     """
-    payload = json.dumps(message).encode("utf-8")
+    # pydantic-core encodes straight to compact UTF-8 bytes (no str round trip)
+    payload = to_json(message)
     if len(payload) > MAX_MESSAGE_SIZE:
         raise IPCMessageSizeError(
             f"Message size {len(payload)} bytes exceeds "
             f"MAX_MESSAGE_SIZE ({MAX_MESSAGE_SIZE} bytes)"
         )
-    prefix = struct.pack("!I", len(payload))
-    writer.write(prefix + payload)
+    prefix = _LENGTH_PREFIX.pack(len(payload))
+    # Hand both buffers to the transport as-is: no prefix + payload copy, and
+    # the selector transport can send them with a single sendmsg()
+    writer.writelines((prefix, payload))
     await writer.drain()
 
 
@@ -153,7 +167,7 @@ async def receive_message(
             f"got {len(exc.partial)}"
         ) from exc
 
-    (payload_length,) = struct.unpack("!I", prefix)
+    (payload_length,) = _LENGTH_PREFIX.unpack(prefix)
     if payload_length > MAX_MESSAGE_SIZE:
         raise IPCMessageSizeError(
             f"Declared message size {payload_length} bytes exceeds "
@@ -169,8 +183,9 @@ async def receive_message(
         ) from exc
 
     try:
-        data: dict[str, object] = json.loads(payload.decode("utf-8"))
-    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        # Parses the raw bytes directly; invalid UTF-8 is rejected as ValueError
+        data: dict[str, object] = from_json(payload)
+    except ValueError as exc:
         raise IPCError(f"Invalid JSON in IPC message: {exc}") from exc
 
     return data
@@ -11,7 +11,6 @@ Architecture::
 """
 
 import asyncio
-import json
 import logging
 import os
 import socket
@@ -21,6 +20,8 @@ import uuid
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 
+from pydantic_core import to_json
+
 from claudecode_model.exceptions import IPCError
 from claudecode_model.ipc.protocol import (
     SCHEMA_FILE_PREFIX,
@@ -97,30 +98,66 @@ class IPCServer:
     ) -> None:
         """Handle a persistent client connection.
 
-        Reads IPC requests in a loop, dispatching each to the appropriate
-        handler and sending the response back.  The loop terminates when
-        the client disconnects (EOF / connection reset).
+        Reads IPC requests in a loop and dispatches each one in its own task,
+        so several requests can be in flight on the connection; responses are
+        sent as they complete, tagged with the request ``id``.  The loop
+        terminates when the client disconnects (EOF / connection reset), after
+        the in-flight requests have finished.
         """
+        in_flight: set[asyncio.Task[None]] = set()
         try:
             while True:
                 try:
                     raw_request = await receive_message(reader)
                 except (asyncio.IncompleteReadError, ConnectionError, IPCError):
                     break  # Client disconnected
-                try:
-                    response = await self._dispatch(raw_request)
-                    await send_message(writer, response)
-                except (ConnectionError, OSError):
-                    break  # Connection lost during response
+                task = asyncio.create_task(self._respond(raw_request, writer))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
         except Exception:
             logger.error("Error handling IPC connection", exc_info=True)
         finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
             writer.close()
             try:
                 await writer.wait_closed()
             except OSError:
                 pass
 
+    async def _respond(
+        self,
+        raw_request: dict[str, object],
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Dispatch one request and send its response, echoing the request id.
+
+        The caller waits on this id, so any failure to build or encode the
+        response is answered with an error response.  If even that cannot be
+        sent, the connection is closed so the client fails the pending call
+        instead of waiting forever.
+        """
+        request_id = raw_request.get("id")
+        try:
+            try:
+                response = await self._dispatch(raw_request)
+                await send_message(writer, _with_id(response, request_id))
+            except OSError:
+                raise
+            except Exception as exc:
+                logger.exception("IPC response %s could not be sent", request_id)
+                error = _error_response(str(exc), type(exc).__name__)
+                await send_message(writer, _with_id(error, request_id))
+        except OSError:
+            # ConnectionError is an OSError subclass
+            logger.debug("Connection lost before IPC response %s was sent", request_id)
+        except Exception:
+            logger.exception(
+                "IPC error response %s could not be sent; closing connection",
+                request_id,
+            )
+            writer.close()
+
     async def _dispatch(
         self, raw_request: dict[str, object]
     ) -> IPCResponse | IPCErrorResponse:
@@ -186,6 +223,15 @@ def _error_response(message: str, error_type: str) -> IPCErrorResponse:
     return {"error": {"message": message, "type": error_type}}
 
 
+def _with_id(
+    response: IPCResponse | IPCErrorResponse, request_id: object
+) -> IPCResponse | IPCErrorResponse:
+    """Tag *response* with the request id, if the request carried one."""
+    if isinstance(request_id, int):
+        response["id"] = request_id
+    return response
+
+
 def _is_socket_active(path: Path) -> bool:
     """Check whether a Unix socket file is actively listening.
 
@@ -257,6 +303,9 @@ class IPCSession:
         self._tool_schemas = tool_schemas
         self._server: IPCServer | None = None
         self._started = False
+        self._active_count = 0
+        self._start_lock: asyncio.Lock | None = None
+        self._start_lock_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def socket_path(self) -> str:
@@ -268,32 +317,62 @@ class IPCSession:
         """Path to the tool schema JSON file."""
         return self._schema_path
 
+    def _get_start_lock(self) -> asyncio.Lock:
+        """Return the lock serializing ``start()`` / ``stop()``.
+
+        Created lazily per event loop: a session reused by a model across
+        ``asyncio.run()`` calls must not wait on a lock bound to an old loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._start_lock is None or self._start_lock_loop is not loop:
+            self._start_lock = asyncio.Lock()
+            self._start_lock_loop = loop
+        return self._start_lock
+
     async def start(self) -> None:
         """Start the IPC session: clean stale sockets, write schema, start server.
 
         Scans the temp directory for stale socket files from previous sessions
         and removes them before starting this session's server.
+
+        Calls are reference-counted so that concurrent requests on the same
+        model (e.g. ``asyncio.gather`` over ``agent.run``) share one server;
+        only the first call actually starts it.
         """
-        if self._started:
-            return
+        # start() and stop() both await; the lock keeps a concurrent caller
+        # from starting a second server on the same socket path, or from
+        # sharing a server that stop() is tearing down
+        async with self._get_start_lock():
+            if not self._started:
+                try:
+                    await self._start_server()
+                except BaseException:
+                    # Leave no schema file or half-started server behind;
+                    # the failed call holds no reference
+                    await self._teardown()
+                    raise
+                self._started = True
+                logger.info(
+                    "IPCSession started: socket=%s, schema=%s, tools=%d",
+                    self._socket_path,
+                    self._schema_path,
+                    len(self._tool_schemas),
+                )
+            self._active_count += 1
 
-        # Clean up stale socket files from previous crashes (FR-010)
-        self._cleanup_stale_sockets()
+    async def _start_server(self) -> None:
+        """Clean stale sockets, write the schema file and start the server."""
+        # Clean up stale socket files from previous crashes (FR-010).
+        # Directory scan, liveness probes and the schema write are blocking
+        # filesystem calls, so they run in a worker thread off the loop
+        await asyncio.to_thread(self._cleanup_stale_sockets)
 
         # Write schema file with restricted permissions
-        self._write_schema_file()
+        await asyncio.to_thread(self._write_schema_file)
 
         # Start IPC server
         self._server = IPCServer(self._socket_path, self._tool_handlers)
         await self._server.start()
-        self._started = True
-
-        logger.info(
-            "IPCSession started: socket=%s, schema=%s, tools=%d",
-            self._socket_path,
-            self._schema_path,
-            len(self._tool_schemas),
-        )
 
     def _cleanup_stale_sockets(self) -> None:
         """Remove stale socket files from previous sessions.
@@ -302,13 +381,20 @@ class IPCSession:
         pattern and removes only those that are truly stale (not actively
         listening).  Active sockets from concurrent sessions are preserved.
         """
-        tmp_dir = Path(tempfile.gettempdir())
-        pattern = f"{SOCKET_FILE_PREFIX}*{SOCKET_FILE_SUFFIX}"
         own_socket = Path(self._socket_path).name
 
-        for candidate in tmp_dir.glob(pattern):
-            if candidate.name == own_socket:
-                continue
+        # scandir + plain prefix/suffix tests: no fnmatch per temp-dir entry,
+        # and a Path is only built for the matching names
+        with os.scandir(tempfile.gettempdir()) as entries:
+            candidates = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith(SOCKET_FILE_PREFIX)
+                and entry.name.endswith(SOCKET_FILE_SUFFIX)
+                and entry.name != own_socket
+            ]
+
+        for candidate in candidates:
             try:
                 if _is_socket_active(candidate):
                     logger.debug("Skipping active socket: %s", candidate)
@@ -326,7 +412,18 @@ class IPCSession:
         """Stop the IPC session: stop server and clean up files.
 
         This method is idempotent — calling it multiple times is safe.
+        While other callers of ``start()`` are still active, only the
+        reference count is decremented and the server keeps running.
         """
+        async with self._get_start_lock():
+            if self._active_count > 1:
+                self._active_count -= 1
+                return
+            self._active_count = 0
+            await self._teardown()
+
+    async def _teardown(self) -> None:
+        """Stop the server and remove the schema file."""
         if self._server is not None:
             await self._server.stop()
             self._server = None
@@ -349,9 +446,11 @@ class IPCSession:
             os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
             SOCKET_PERMISSIONS,
         )
+        # Encode to UTF-8 bytes in one pass and write them through a binary
+        # file, skipping the text-mode encoder and json.dump's chunked writes
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(self._tool_schemas, f)
+            with os.fdopen(fd, "wb") as f:
+                f.write(to_json(self._tool_schemas))
         except Exception:
             # fd is closed by os.fdopen even on error
             raise
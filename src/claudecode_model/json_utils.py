@@ -4,8 +4,20 @@ from __future__ import annotations
 
 import json
 import re
+
+from pydantic_core import from_json
+
 from claudecode_model.types import JsonValue
 
+# Shared decoder; raw_decode parses a JSON value starting at a given index
+_DECODER = json.JSONDecoder()
+
+# Opening marker of a ```json fenced code block
+_JSON_FENCE_MARKER = "```json"
+
+# Body of a ```json ... ``` fenced code block
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+
 
 def extract_json(text: str) -> dict[str, JsonValue]:
     """Extract JSON from CLI output text.
@@ -28,30 +40,31 @@ def extract_json(text: str) -> dict[str, JsonValue]:
     text_stripped = text.strip()
     failures: list[str] = []
 
-    # Strategy 1: Direct JSON parse
+    # Strategy 1: Direct JSON parse (pydantic-core's native parser; invalid
+    # JSON raises ValueError)
     try:
-        result = json.loads(text_stripped)
+        result = from_json(text_stripped)
         if isinstance(result, dict):
             return result
         return {"value": result}  # Wrap non-dict in dict
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         failures.append(f"direct parse: {e}")
 
     # Strategy 2: Extract from ```json ... ``` blocks
-    match = re.search(r"```json\s*(.*?)\s*```", text, re.DOTALL)
+    # A substring check skips the regex engine for output without a fence
+    match = _JSON_FENCE_RE.search(text) if _JSON_FENCE_MARKER in text else None
     if match:
         try:
-            result = json.loads(match.group(1))
+            result = from_json(match.group(1))
             if isinstance(result, dict):
                 return result
             return {"value": result}
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             failures.append(f"code block: {e}")
     else:
         failures.append("code block: no ```json``` block found")
 
-    # Strategy 3: Find JSON object pattern (greedy, handles nested)
-    # Use bracket counting approach
+    # Strategy 3: Find JSON object pattern (handles nested)
     obj_result = _find_json_object(text, failures)
     if obj_result is not None:
         return obj_result
@@ -73,66 +86,37 @@ def extract_json(text: str) -> dict[str, JsonValue]:
 def _find_json_structure(
     text: str,
     start_char: str,
-    end_char: str,
     pattern_name: str,
     failures: list[str] | None = None,
 ) -> dict[str, JsonValue] | list[JsonValue] | None:
     """Find and parse the first JSON structure in text.
 
-    Uses bracket counting to handle nested structures and tracks string context
-    to correctly handle brackets/braces inside strings.
+    Jumps between candidate opening characters with ``str.find`` and lets the
+    C-accelerated ``JSONDecoder.raw_decode`` parse from each one, so nesting
+    and brackets inside strings are handled by the JSON scanner itself.
 
     Args:
         text: Text to search
         start_char: Opening character ('{' for objects, '[' for arrays)
-        end_char: Closing character ('}' for objects, ']' for arrays)
         pattern_name: Name for error messages ('object' or 'array')
         failures: Optional list to append failure reasons to
 
     Returns:
         Parsed JSON structure or None if not found
     """
-    found_start = False
+    start = text.find(start_char)
+    found_start = start != -1
     last_error: str | None = None
 
-    for i, char in enumerate(text):
-        if char == start_char:
-            found_start = True
-            depth = 1
-            in_string = False
-            escape_next = False
-
-            for j in range(i + 1, len(text)):
-                c = text[j]
-
-                if escape_next:
-                    escape_next = False
-                    continue
-
-                if c == "\\":
-                    escape_next = True
-                    continue
-
-                if c == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-
-                if in_string:
-                    continue
-
-                if c == start_char:
-                    depth += 1
-                elif c == end_char:
-                    depth -= 1
-                    if depth == 0:
-                        try:
-                            return json.loads(text[i : j + 1])
-                        except json.JSONDecodeError as e:
-                            last_error = str(e)
-                            # Continue searching for next structure
-                            break
-            # If we get here without returning, this start_char didn't lead to valid JSON
-            # Continue to find next start_char
+    while start != -1:
+        try:
+            result, _end = _DECODER.raw_decode(text, start)
+            return result
+        except json.JSONDecodeError as e:
+            # Running off the end of the text means the structure is unclosed
+            if e.pos < len(text):
+                last_error = str(e)
+        start = text.find(start_char, start + 1)
 
     if failures is not None:
         if not found_start:
@@ -157,7 +141,7 @@ def _find_json_object(
     Returns:
         Parsed JSON object or None if not found
     """
-    result = _find_json_structure(text, "{", "}", "object", failures)
+    result = _find_json_structure(text, "{", "object", failures)
     if result is not None:
         if isinstance(result, dict):
             return result
@@ -178,7 +162,7 @@ def _find_json_array(
     Returns:
         Parsed JSON array or None if not found
     """
-    result = _find_json_structure(text, "[", "]", "array", failures)
+    result = _find_json_structure(text, "[", "array", failures)
     if result is not None:
         if isinstance(result, list):
             return result
@@ -211,6 +211,8 @@ class ClaudeCodeModel(Model):
         self._mcp_servers: dict[str, McpSdkServerConfig | McpStdioServerConfig] = {}
         self._agent_toolsets: Sequence[PydanticAITool] | AgentToolset | None = None
         self._tools_cache: dict[str, PydanticAITool] = {}
+        # Tool names the current MCP server / IPC session was built for
+        self._served_tool_names: frozenset[str] | None = None
         self._current_server_name: str = MCP_SERVER_NAME
         self._ipc_session: IPCSession | None = None
         self._transport: TransportType = DEFAULT_TRANSPORT
@@ -1265,7 +1267,14 @@ class ClaudeCodeModel(Model):
 
         Side Effects:
             Updates self._mcp_servers with a new MCP server containing only
-            the matched tools from function_tools.
+            the matched tools from function_tools. The server (and, in stdio
+            mode, its IPC session) is kept for later requests and rebuilt
+            only when the set of requested tool names changes.
+
+        Note:
+            The MCP server and IPC session are per-model state. Concurrent
+            requests on one model must request the same tool set; a request
+            with a different set replaces the server the others are using.
         """
         if not function_tools:
             return
@@ -1291,6 +1300,12 @@ class ClaudeCodeModel(Model):
                 missing_tools=missing_tools, available_tools=available_tools
             )
 
+        # A set: the order of function_tools does not change the server
+        matched_names = frozenset(tool_names)
+        if matched_tools and matched_names == self._served_tool_names:
+            # Same tool set as the current server; skip rebuilding it
+            return
+
         if matched_tools:
             # Update MCP server with matched tools only, preserving transport mode
             server_name = self._current_server_name
@@ -1306,6 +1321,7 @@ class ClaudeCodeModel(Model):
                 self._mcp_servers[server_name] = self._create_mcp_server_with_deps(
                     server_name, matched_tools
                 )
+            self._served_tool_names = matched_names
 
     async def _start_ipc_server(self) -> None:
         """Start the IPC server if an IPC session is configured.
@@ -1589,6 +1605,9 @@ class ClaudeCodeModel(Model):
             self._mcp_servers[server_name] = self._create_mcp_server_with_deps(
                 server_name, tools_for_mcp
             )
+        self._served_tool_names = (
+            frozenset(self._tools_cache) if tools_for_mcp is not None else None
+        )
 
         registered_names = list(self._tools_cache.keys())
         logger.debug(
@@ -14,7 +14,9 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import weakref
 from collections.abc import Awaitable, Callable, Mapping, Sequence
+from functools import partial
 from typing import Literal, TypedDict
 
 from claude_agent_sdk import SdkMcpTool, create_sdk_mcp_server
@@ -33,6 +35,22 @@ logger = logging.getLogger(__name__)
 # Type alias for JSON schema dict
 type JsonSchema = dict[str, object]
 
+# Latest convert_tool_with_deps result per live tool, keyed by id(tool). The
+# tool is held only through a weak reference whose callback evicts the entry
+# when the tool is garbage collected (Tool is unhashable, so a
+# WeakKeyDictionary cannot be used). The deps object is kept in the entry to
+# be compared by identity; the converted tool's handler references it anyway.
+_convert_cache: dict[
+    int, tuple[weakref.ref[Tool[object]], object, SdkMcpTool[JsonSchema]]
+] = {}
+
+
+def _evict_converted_tool(key: int, tool_ref: weakref.ref[Tool[object]]) -> None:
+    """Drop the cache entry of a garbage-collected tool."""
+    entry = _convert_cache.get(key)
+    if entry is not None and entry[0] is tool_ref:
+        del _convert_cache[key]
+
 
 class McpTextContent(TypedDict):
     """MCP text content block."""
@@ -228,6 +246,12 @@ def convert_tool_with_deps[T](tool: Tool[T], deps: T) -> SdkMcpTool[JsonSchema]:
         The tool's input schema will not include the 'ctx' parameter,
         as the context is injected automatically at runtime.
 
+        Repeated calls with the same ``tool`` and ``deps`` objects return
+        the same cached ``SdkMcpTool``. Only the latest conversion of each
+        tool is kept, and only while the tool itself is alive; its ``deps``
+        object stays referenced until then, or until
+        ``clear_conversion_cache()`` is called.
+
     Examples:
         >>> from pydantic_ai import Agent, RunContext
         >>> from pydantic_ai.toolsets.function import FunctionToolset
@@ -248,13 +272,27 @@ def convert_tool_with_deps[T](tool: Tool[T], deps: T) -> SdkMcpTool[JsonSchema]:
     if not isinstance(tool, Tool):
         raise TypeError(f"expected Tool, got {type(tool).__name__}")
 
+    key = id(tool)
+    cached = _convert_cache.get(key)
+    if cached is not None and cached[0]() is tool and cached[1] is deps:
+        return cached[2]
+
     # Create deps context with validation (raises UnsupportedDepsTypeError if not serializable)
     # DepsContext[T] is invariant, but we only read deps via the .deps property,
     # so widening to DepsContext[object] is safe at runtime. The type: ignore
     # suppresses the assignment error from T -> object covariance mismatch.
     deps_context: DepsContext[object] = create_deps_context(deps)  # type: ignore[assignment]
 
-    return convert_tool_with_context(tool, deps_context)  # type: ignore[arg-type]
+    sdk_tool = convert_tool_with_context(tool, deps_context)  # type: ignore[arg-type]
+
+    tool_ref = weakref.ref(tool, partial(_evict_converted_tool, key))
+    _convert_cache[key] = (tool_ref, deps, sdk_tool)  # type: ignore[assignment]
+    return sdk_tool
+
+
+def clear_conversion_cache() -> None:
+    """Drop all cached ``convert_tool_with_deps`` results."""
+    _convert_cache.clear()
 
 
 def convert_tool_with_context(
@@ -1,13 +1,29 @@
 """Shared test helpers for claudecode_model tests."""
 
+from collections.abc import Generator
 from typing import Any
 
+import pytest
 from claude_agent_sdk import ResultMessage
 from pydantic_ai import Agent
 from pydantic_ai.tools import Tool
 from pydantic_ai.toolsets.function import FunctionToolset
 
 
+@pytest.fixture(autouse=True)
+def _clear_cli_path_cache() -> Generator[None]:
+    """Reset the process-wide claude CLI path cache around each test.
+
+    Tests patch ``shutil.which`` with different results, so a path resolved
+    in one test must not leak into the next.
+    """
+    from claudecode_model.cli import _resolve_claude_cli
+
+    _resolve_claude_cli.cache_clear()
+    yield
+    _resolve_claude_cli.cache_clear()
+
+
 def create_mock_result_message(
     result: str = "Response from Claude",
     is_error: bool = False,
@@ -142,6 +142,13 @@ class TestClaudeCodeCLIFindCLI:
             cli._find_cli()
             mock_which.assert_called_once()
 
+    def test_shares_cli_path_across_instances(self) -> None:
+        """The PATH lookup should run once for all ClaudeCodeCLI instances."""
+        with patch("shutil.which", return_value="/usr/bin/claude") as mock_which:
+            ClaudeCodeCLI()._find_cli()
+            ClaudeCodeCLI()._find_cli()
+            mock_which.assert_called_once()
+
     def test_raises_when_cli_not_found(self) -> None:
         """_find_cli should raise CLINotFoundError when not found."""
         cli = ClaudeCodeCLI()
@@ -166,6 +173,17 @@ class TestClaudeCodeCLIBuildCommand:
             assert DEFAULT_MODEL in cmd
             assert cmd[-1] == "Hello"
 
+    def test_reflects_attribute_changes_after_construction(self) -> None:
+        """_build_command should use the current attribute values."""
+        cli = ClaudeCodeCLI()
+        with patch("shutil.which", return_value="/usr/bin/claude"):
+            cli._build_command("first")
+            cli.model = "claude-opus-4-5"
+            cli.permission_mode = "bypassPermissions"
+            cmd = cli._build_command("second")
+        assert "claude-opus-4-5" in cmd
+        assert "bypassPermissions" in cmd
+
     def test_includes_permission_mode(self) -> None:
         """_build_command should include permission mode if set."""
         cli = ClaudeCodeCLI(permission_mode="bypassPermissions")
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Annotated
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
@@ -34,6 +37,44 @@ class NestedSettings:
     inner: AppSettings
 
 
+@dataclass
+class Measurement:
+    """Test dataclass with float and tuple fields."""
+
+    ratio: float
+    point: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class FrozenSettings:
+    """Test frozen (hashable) dataclass for dependencies."""
+
+    name: str
+    retries: int
+
+
+@dataclass(frozen=True)
+class FrozenNote:
+    """Test frozen dataclass with a field excluded from equality."""
+
+    debug: int
+    note: str = field(default="", compare=False)
+
+
+@dataclass(frozen=True)
+class FrozenFloat:
+    """Test frozen dataclass whose equal values differ in JSON (1 vs 1.0)."""
+
+    x: float
+
+
+@dataclass(frozen=True)
+class FrozenTags:
+    """Test frozen dataclass with an unhashable field value."""
+
+    tags: list[str]
+
+
 class TestIsSerializableType:
     """Tests for is_serializable_type function."""
 
@@ -94,6 +135,46 @@ class TestIsSerializableType:
 
         assert is_serializable_type(SomeClass) is False
 
+    def test_result_is_cached_per_type(self) -> None:
+        """Repeated checks for the same type are served from the cache."""
+        from claudecode_model.deps_support import (
+            _is_serializable_type_cached,
+            is_serializable_type,
+        )
+
+        _is_serializable_type_cached.cache_clear()
+        assert is_serializable_type(AppSettings) is True
+        assert is_serializable_type(AppSettings) is True
+
+        info = _is_serializable_type_cached.cache_info()
+        assert info.misses >= 1
+        assert info.hits >= 1
+
+    def test_unhashable_type_is_checked_without_cache(self) -> None:
+        """Unhashable types such as Annotated with dict metadata do not raise."""
+        from claudecode_model.deps_support import is_serializable_type
+
+        assert is_serializable_type(Annotated[int, {"doc": "x"}]) is False
+        assert is_serializable_type(list[Annotated[int, {"doc": "x"}]]) is False
+
+    def test_error_inside_check_is_not_retried_uncached(self) -> None:
+        """A TypeError raised by the check itself propagates after one call."""
+        from claudecode_model.deps_support import is_serializable_type
+
+        class Unchecked:
+            pass
+
+        with (
+            patch(
+                "claudecode_model.deps_support._check_serializable_type",
+                side_effect=TypeError("bug"),
+            ) as mock_check,
+            pytest.raises(TypeError, match="bug"),
+        ):
+            is_serializable_type(Unchecked)
+
+        mock_check.assert_called_once_with(Unchecked)
+
 
 class TestGenericTypeSerializability:
     """Tests for generic type serializability checking."""
@@ -148,6 +229,29 @@ class TestGenericTypeSerializability:
 class TestSerializeDeps:
     """Tests for serialize_deps function."""
 
+    def test_serializes_equal_frozen_dataclasses_by_their_own_values(self) -> None:
+        """Frozen instances that compare equal still serialize their own fields."""
+        from claudecode_model.deps_support import serialize_deps
+
+        assert json.loads(serialize_deps(FrozenNote(debug=1))) == {
+            "debug": 1,
+            "note": "",
+        }
+        assert json.loads(serialize_deps(FrozenNote(debug=True, note="b"))) == {
+            "debug": True,
+            "note": "b",
+        }
+        assert serialize_deps(FrozenFloat(x=1)) == '{"x":1}'
+        assert serialize_deps(FrozenFloat(x=1.0)) == '{"x":1.0}'
+
+    def test_serializes_frozen_dataclass_with_unhashable_field(self) -> None:
+        """Frozen dataclass holding a list field is serialized."""
+        from claudecode_model.deps_support import serialize_deps
+
+        deps = FrozenTags(tags=["a", "b"])
+
+        assert json.loads(serialize_deps(deps)) == {"tags": ["a", "b"]}
+
     def test_serializes_dict(self) -> None:
         """dict should serialize to JSON."""
         from claudecode_model.deps_support import serialize_deps
@@ -177,7 +281,7 @@ class TestSerializeDeps:
         assert json.loads(serialize_deps(None)) is None
 
     def test_serializes_dataclass(self) -> None:
-        """dataclass should serialize via asdict to JSON."""
+        """dataclass should serialize its fields to JSON."""
         from claudecode_model.deps_support import serialize_deps
 
         deps = AppSettings(
@@ -220,6 +324,49 @@ class TestSerializeDeps:
         parsed = json.loads(result)
         assert parsed == {"username": "alice", "api_key": "secret123", "timeout": 60}
 
+    def test_serializes_to_bytes(self) -> None:
+        """serialize_deps_bytes should return the encoded serialize_deps output."""
+        from claudecode_model.deps_support import serialize_deps, serialize_deps_bytes
+
+        deps = UserConfig(username="alice", api_key="secret123", timeout=60)
+
+        assert serialize_deps_bytes(deps) == deps.model_dump_json().encode()
+        assert serialize_deps_bytes({"key": "value"}) == b'{"key":"value"}'
+        assert serialize_deps_bytes(FrozenSettings(name="a", retries=1)) == (
+            serialize_deps(FrozenSettings(name="a", retries=1)).encode()
+        )
+
+    def test_output_is_compact_with_unescaped_non_ascii(self) -> None:
+        """Output has no separator whitespace and keeps non-ASCII as UTF-8."""
+        from claudecode_model.deps_support import serialize_deps, serialize_deps_bytes
+
+        assert serialize_deps({"name": "café", "n": [1, 2]}) == (
+            '{"name":"café","n":[1,2]}'
+        )
+        assert serialize_deps_bytes({"name": "café"}) == ('{"name":"café"}'.encode())
+
+    def test_encodes_values_json_dumps_rejected(self) -> None:
+        """datetime, date, bytes and set values are encoded by pydantic-core."""
+        from claudecode_model.deps_support import serialize_deps
+
+        deps = {
+            "at": datetime(2024, 1, 2, 3, 4, 5),
+            "day": date(2024, 1, 2),
+            "raw": b"abc",
+            "tags": {"x"},
+        }
+
+        assert serialize_deps(deps) == (
+            '{"at":"2024-01-02T03:04:05","day":"2024-01-02","raw":"abc","tags":["x"]}'
+        )
+
+    def test_unencodable_value_raises_type_error(self) -> None:
+        """A value that cannot be encoded raises TypeError, as json.dumps did."""
+        from claudecode_model.deps_support import serialize_deps
+
+        with pytest.raises(TypeError, match="Unable to serialize"):
+            serialize_deps({"client": object()})
+
     def test_raises_on_unsupported_type(self) -> None:
         """Unsupported types should raise UnsupportedDepsTypeError."""
         import httpx
@@ -243,6 +390,25 @@ class TestSerializeDeps:
 class TestDeserializeDeps:
     """Tests for deserialize_deps function."""
 
+    def test_reuses_decoder_per_type(self) -> None:
+        """The decoder for a deps type is built once and reused."""
+        from claudecode_model.deps_support import _deps_decoder, deserialize_deps
+
+        _deps_decoder.cache_clear()
+        deserialize_deps('{"name": "a", "retries": 1}', FrozenSettings)
+        deserialize_deps('{"name": "b", "retries": 2}', FrozenSettings)
+
+        assert _deps_decoder.cache_info().hits == 1
+
+    def test_deserializes_from_bytes(self) -> None:
+        """Bytes input should deserialize the same as str input."""
+        from claudecode_model.deps_support import deserialize_deps
+
+        assert deserialize_deps(b'{"key": "value"}', dict) == {"key": "value"}
+        assert deserialize_deps(b'{"name": "a", "retries": 1}', FrozenSettings) == (
+            FrozenSettings(name="a", retries=1)
+        )
+
     def test_deserializes_to_dict(self) -> None:
         """JSON should deserialize to dict when no type hint provided."""
         from claudecode_model.deps_support import deserialize_deps
@@ -327,6 +493,45 @@ class TestDeserializeDeps:
         with pytest.raises(json.JSONDecodeError):
             deserialize_deps("not valid json", dict)
 
+    def test_dataclass_rejects_mismatched_field_type(self) -> None:
+        """Dataclass fields should not be coerced from other JSON types."""
+        from pydantic import ValidationError
+
+        from claudecode_model.deps_support import deserialize_deps
+
+        json_str = '{"debug": true, "max_retries": "3", "base_url": "http://x"}'
+        with pytest.raises(ValidationError, match="max_retries"):
+            deserialize_deps(json_str, AppSettings)
+
+    def test_dataclass_accepts_int_for_float_and_array_for_tuple(self) -> None:
+        """Strict validation still allows int -> float and JSON array -> tuple."""
+        from claudecode_model.deps_support import deserialize_deps
+
+        result = deserialize_deps('{"ratio": 1, "point": [1, 2]}', Measurement)
+
+        assert result == Measurement(ratio=1.0, point=(1, 2))
+        assert type(result.ratio) is float
+
+    def test_raises_validation_error_on_invalid_json_for_dataclass(self) -> None:
+        """Invalid JSON for a dataclass should raise ValidationError."""
+        from pydantic import ValidationError
+
+        from claudecode_model.deps_support import deserialize_deps
+
+        with pytest.raises(ValidationError, match="json_invalid"):
+            deserialize_deps("not valid json", AppSettings)
+
+    def test_raises_validation_error_on_invalid_json_for_pydantic_model(
+        self,
+    ) -> None:
+        """Invalid JSON for a Pydantic model should raise ValidationError."""
+        from pydantic import ValidationError
+
+        from claudecode_model.deps_support import deserialize_deps
+
+        with pytest.raises(ValidationError, match="json_invalid"):
+            deserialize_deps("not valid json", UserConfig)
+
 
 class TestUnsupportedDepsTypeError:
     """Tests for UnsupportedDepsTypeError exception."""
@@ -513,3 +718,10 @@ class TestDepsContextConstructorValidation:
 
         ctx = DepsContext({"api_key": "secret"})
         assert ctx.deps == {"api_key": "secret"}
+
+    def test_deps_context_has_no_instance_dict(self) -> None:
+        """DepsContext should store deps in a slot, not a per-instance __dict__."""
+        from claudecode_model.deps_support import DepsContext
+
+        ctx = DepsContext({"api_key": "secret"})
+        assert not hasattr(ctx, "__dict__")
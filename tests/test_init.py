@@ -0,0 +1,72 @@
+"""Tests for the lazy public namespace in claudecode_model/__init__.py."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import claudecode_model
+
+
+class TestLazyImports:
+    """Tests for PEP 562 lazy resolution of public names."""
+
+    def test_import_does_not_load_submodules(self) -> None:
+        """Importing the package should not import model or the SDK."""
+        code = (
+            "import sys, claudecode_model; "
+            "print('claudecode_model.model' in sys.modules, "
+            "'claude_agent_sdk' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.split() == ["False", "False"]
+
+    def test_submodules_resolve_as_attributes(self) -> None:
+        """Submodules should be reachable after a bare package import."""
+        code = (
+            "import claudecode_model; "
+            "print(claudecode_model.exceptions.__name__, "
+            "claudecode_model.model.__name__, "
+            "claudecode_model.deps_support.__name__, "
+            "claudecode_model.ipc.__name__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.split() == [
+            "claudecode_model.exceptions",
+            "claudecode_model.model",
+            "claudecode_model.deps_support",
+            "claudecode_model.ipc",
+        ]
+
+    def test_every_public_name_resolves(self) -> None:
+        """Every name in __all__ should resolve to its submodule attribute."""
+        for name in claudecode_model.__all__:
+            assert getattr(claudecode_model, name) is not None
+
+    def test_resolved_name_cached_in_module_namespace(self) -> None:
+        """A resolved name should be stored so __getattr__ is not re-entered."""
+        from claudecode_model.model import ClaudeCodeModel
+
+        assert claudecode_model.ClaudeCodeModel is ClaudeCodeModel
+        assert vars(claudecode_model)["ClaudeCodeModel"] is ClaudeCodeModel
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        """Unknown attributes should raise AttributeError, not KeyError."""
+        with pytest.raises(AttributeError, match="no attribute 'missing_name'"):
+            _ = claudecode_model.missing_name
+
+    def test_dir_lists_public_names(self) -> None:
+        """dir() should include lazy names before they are resolved."""
+        assert set(claudecode_model.__all__) <= set(dir(claudecode_model))
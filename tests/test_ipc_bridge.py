@@ -184,9 +184,10 @@ class TestIPCClient:
 
         # Prepare mock response data
         response: IPCResponse = {
+            "id": 0,
             "result": {
                 "content": [{"type": "text", "text": "42"}],
-            }
+            },
         }
         response_payload = json.dumps(response).encode("utf-8")
         response_frame = struct.pack("!I", len(response_payload)) + response_payload
@@ -197,8 +198,6 @@ class TestIPCClient:
         mock_reader.feed_eof()
 
         mock_writer = MagicMock(spec=asyncio.StreamWriter)
-        written_data = bytearray()
-        mock_writer.write = MagicMock(side_effect=lambda d: written_data.extend(d))
         mock_writer.drain = AsyncMock()
 
         client = IPCClient("/tmp/test.sock")
@@ -211,14 +210,52 @@ class TestIPCClient:
 
         assert result == response["result"]
 
+    async def test_concurrent_call_tool_routes_responses_by_id(self) -> None:
+        """Concurrent call_tool requests share the socket; responses match by id."""
+        from claudecode_model.ipc.bridge import IPCClient
+
+        def make_response_frame(request_id: int, text: str) -> bytes:
+            response: IPCResponse = {
+                "id": request_id,
+                "result": {"content": [{"type": "text", "text": text}]},
+            }
+            payload = json.dumps(response).encode("utf-8")
+            return struct.pack("!I", len(payload)) + payload
+
+        mock_reader = asyncio.StreamReader()
+        mock_writer = MagicMock(spec=asyncio.StreamWriter)
+        mock_writer.drain = AsyncMock()
+
+        client = IPCClient("/tmp/test.sock")
+        client._reader = mock_reader
+        client._writer = mock_writer
+        client._connected = True
+
+        first = asyncio.create_task(client.call_tool("tool_a", {}))
+        second = asyncio.create_task(client.call_tool("tool_b", {}))
+        await asyncio.sleep(0)
+
+        # Both requests are in flight before any response arrives
+        assert mock_writer.writelines.call_count == 2
+
+        # Answer out of order
+        mock_reader.feed_data(make_response_frame(1, "b"))
+        mock_reader.feed_data(make_response_frame(0, "a"))
+
+        result_a, result_b = await asyncio.gather(first, second)
+
+        assert result_a["content"][0]["text"] == "a"
+        assert result_b["content"][0]["text"] == "b"
+
     async def test_call_tool_lazy_connects(self) -> None:
         """First call_tool triggers connection to socket."""
         from claudecode_model.ipc.bridge import IPCClient
 
         response: IPCResponse = {
+            "id": 0,
             "result": {
                 "content": [{"type": "text", "text": "ok"}],
-            }
+            },
         }
         response_payload = json.dumps(response).encode("utf-8")
         response_frame = struct.pack("!I", len(response_payload)) + response_payload
@@ -248,19 +285,20 @@ class TestIPCClient:
         """Subsequent call_tool reuses the existing connection."""
         from claudecode_model.ipc.bridge import IPCClient
 
-        def make_response_frame() -> bytes:
+        def make_response_frame(request_id: int) -> bytes:
             response: IPCResponse = {
+                "id": request_id,
                 "result": {
                     "content": [{"type": "text", "text": "ok"}],
-                }
+                },
             }
             payload = json.dumps(response).encode("utf-8")
             return struct.pack("!I", len(payload)) + payload
 
         # Feed two responses
         mock_reader = asyncio.StreamReader()
-        mock_reader.feed_data(make_response_frame())
-        mock_reader.feed_data(make_response_frame())
+        mock_reader.feed_data(make_response_frame(0))
+        mock_reader.feed_data(make_response_frame(1))
         mock_reader.feed_eof()
 
         mock_writer = MagicMock(spec=asyncio.StreamWriter)
@@ -297,10 +335,11 @@ class TestIPCClient:
         from claudecode_model.ipc.bridge import IPCClient
 
         error_response: IPCErrorResponse = {
+            "id": 0,
             "error": {
                 "message": "Tool 'unknown' not found",
                 "type": "ToolNotFoundError",
-            }
+            },
         }
         payload = json.dumps(error_response).encode("utf-8")
         frame = struct.pack("!I", len(payload)) + payload
@@ -326,10 +365,11 @@ class TestIPCClient:
         from claudecode_model.ipc.bridge import IPCClient
 
         error_response: IPCErrorResponse = {
+            "id": 0,
             "error": {
                 "message": "Division by zero",
                 "type": "ZeroDivisionError",
-            }
+            },
         }
         payload = json.dumps(error_response).encode("utf-8")
         frame = struct.pack("!I", len(payload)) + payload
@@ -349,3 +389,58 @@ class TestIPCClient:
 
         with pytest.raises(IPCError, match="Division by zero"):
             await client.call_tool("calculator", {"expression": "1/0"})
+
+    @pytest.mark.parametrize(
+        "frame_payload",
+        [["not", "an", "object"], {"result": {"content": []}}],
+        ids=["non_object", "missing_id"],
+    )
+    async def test_call_tool_fails_on_unroutable_response(
+        self, frame_payload: object
+    ) -> None:
+        """A response that cannot be routed by id fails the pending call."""
+        from claudecode_model.ipc.bridge import IPCClient
+
+        payload = json.dumps(frame_payload).encode("utf-8")
+        frame = struct.pack("!I", len(payload)) + payload
+
+        mock_reader = asyncio.StreamReader()
+        mock_reader.feed_data(frame)
+
+        mock_writer = MagicMock(spec=asyncio.StreamWriter)
+        mock_writer.drain = AsyncMock()
+
+        client = IPCClient("/tmp/test.sock")
+        client._reader = mock_reader
+        client._writer = mock_writer
+        client._connected = True
+
+        with pytest.raises(IPCError, match="integer 'id'"):
+            await asyncio.wait_for(client.call_tool("test_tool", {}), timeout=1)
+
+    async def test_call_tool_fails_when_reader_raises_unexpectedly(self) -> None:
+        """An unexpected reader failure fails the pending call, not hangs it."""
+        from claudecode_model.ipc.bridge import IPCClient
+
+        mock_writer = MagicMock(spec=asyncio.StreamWriter)
+        mock_writer.drain = AsyncMock()
+
+        client = IPCClient("/tmp/test.sock")
+        client._reader = asyncio.StreamReader()
+        client._writer = mock_writer
+        client._connected = True
+
+        with (
+            patch(
+                "claudecode_model.ipc.bridge.receive_message",
+                side_effect=RuntimeError("boom"),
+            ),
+            pytest.raises(IPCError, match="reader stopped"),
+        ):
+            await asyncio.wait_for(client.call_tool("test_tool", {}), timeout=1)
+
+        # The bug stays on the reader task, and closing must not raise
+        assert client._reader_task is not None
+        assert isinstance(client._reader_task.exception(), RuntimeError)
+        await client.close()
+        assert client._reader_task is None
@@ -700,6 +700,53 @@ class TestProcessFunctionToolsTransportPreservation:
         # New session should be a different object (regenerated)
         assert new_session is not original_session
 
+    def test_ipc_session_reused_for_unchanged_tool_set(self) -> None:
+        """When function_tools match the tools already served, the existing
+        IPCSession is reused instead of being regenerated."""
+        model = ClaudeCodeModel()
+        tool1 = _create_mock_tool("tool_a")
+        tool2 = _create_mock_tool("tool_b")
+        model.set_agent_toolsets([tool1, tool2], transport="stdio")
+
+        original_session = model._ipc_session
+        assert original_session is not None
+
+        tool_def_a = MagicMock()
+        tool_def_a.name = "tool_a"
+        tool_def_b = MagicMock()
+        tool_def_b.name = "tool_b"
+        model._process_function_tools([tool_def_a, tool_def_b])
+
+        assert model._ipc_session is original_session
+
+    def test_ipc_session_rebuilt_only_when_tool_subset_changes(self) -> None:
+        """Alternating tool subsets rebuild the session; reordering does not."""
+        model = ClaudeCodeModel()
+        tools = [_create_mock_tool(name) for name in ("tool_a", "tool_b", "tool_c")]
+        model.set_agent_toolsets(tools, transport="stdio")
+
+        def tool_defs(*names: str) -> list[MagicMock]:
+            defs = []
+            for name in names:
+                tool_def = MagicMock()
+                tool_def.name = name
+                defs.append(tool_def)
+            return defs
+
+        model._process_function_tools(tool_defs("tool_a", "tool_b"))
+        first_subset_session = model._ipc_session
+
+        model._process_function_tools(tool_defs("tool_b", "tool_a"))
+        assert model._ipc_session is first_subset_session
+
+        model._process_function_tools(tool_defs("tool_c"))
+        second_subset_session = model._ipc_session
+        assert second_subset_session is not first_subset_session
+
+        model._process_function_tools(tool_defs("tool_a", "tool_b"))
+        assert model._ipc_session is not second_subset_session
+        assert model._ipc_session is not first_subset_session
+
     def test_sdk_no_ipc_session_after_filtering(self) -> None:
         """After _process_function_tools() in sdk mode, no IPCSession exists."""
         model = ClaudeCodeModel()
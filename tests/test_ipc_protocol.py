@@ -15,6 +15,7 @@ import struct
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pydantic_core import to_json
 
 from claudecode_model.exceptions import IPCError, IPCMessageSizeError
 from claudecode_model.ipc.protocol import (
@@ -46,6 +47,11 @@ class TestProtocolConstants:
     def test_length_prefix_size(self) -> None:
         assert LENGTH_PREFIX_SIZE == 4
 
+    def test_length_prefix_codec_matches_size(self) -> None:
+        from claudecode_model.ipc.protocol import _LENGTH_PREFIX
+
+        assert _LENGTH_PREFIX.size == LENGTH_PREFIX_SIZE
+
     def test_socket_permissions(self) -> None:
         assert SOCKET_PERMISSIONS == 0o600
 
@@ -64,7 +70,7 @@ class TestMessageTypedDicts:
 
     def test_ipc_request_construction(self) -> None:
         params: CallToolParams = {"name": "my_tool", "arguments": {"key": "value"}}
-        request: IPCRequest = {"method": "call_tool", "params": params}
+        request: IPCRequest = {"id": 1, "method": "call_tool", "params": params}
 
         assert request["method"] == "call_tool"
         assert request["params"]["name"] == "my_tool"
@@ -100,7 +106,7 @@ class TestMessageTypedDicts:
             "name": "calculator",
             "arguments": {"expression": "2+2"},
         }
-        request: IPCRequest = {"method": "call_tool", "params": params}
+        request: IPCRequest = {"id": 1, "method": "call_tool", "params": params}
 
         serialized = json.dumps(request)
         deserialized = json.loads(serialized)
@@ -207,7 +213,9 @@ def _create_mock_writer() -> tuple[MagicMock, bytearray]:
     """Create a mock StreamWriter that captures written bytes."""
     buffer = bytearray()
     writer = MagicMock(spec=asyncio.StreamWriter)
-    writer.write = MagicMock(side_effect=lambda data: buffer.extend(data))
+    writer.writelines = MagicMock(
+        side_effect=lambda chunks: buffer.extend(b"".join(chunks))
+    )
     writer.drain = AsyncMock()
     return writer, buffer
 
@@ -240,11 +248,12 @@ class TestLengthPrefixFraming:
         writer, buffer = _create_mock_writer()
         await send_message(writer, message)
 
-        payload = json.dumps(message).encode("utf-8")
+        payload = to_json(message)
         expected_prefix = struct.pack("!I", len(payload))
 
         assert bytes(buffer[:LENGTH_PREFIX_SIZE]) == expected_prefix
         assert bytes(buffer[LENGTH_PREFIX_SIZE:]) == payload
+        writer.writelines.assert_called_once()
 
     async def test_receive_message_parses_json(self) -> None:
         message = {"result": {"content": [{"type": "text", "text": "hello"}]}}
@@ -311,13 +320,13 @@ class TestMaxMessageSizeValidation:
         # Create a message whose JSON payload is exactly MAX_MESSAGE_SIZE bytes
         # We need to calculate the overhead of JSON encoding
         base_message = {"d": ""}
-        base_overhead = len(json.dumps(base_message).encode("utf-8")) - 0
+        base_overhead = len(to_json(base_message))
         # Fill to exact limit
         fill_size = MAX_MESSAGE_SIZE - base_overhead
         message = {"d": "a" * fill_size}
 
         # Verify it's exactly at the limit
-        payload = json.dumps(message).encode("utf-8")
+        payload = to_json(message)
         assert len(payload) == MAX_MESSAGE_SIZE
 
         writer, buffer = _create_mock_writer()
@@ -356,6 +365,15 @@ class TestInvalidJsonHandling:
         with pytest.raises(IPCError):
             await receive_message(reader)
 
+    async def test_receive_invalid_utf8_raises_error(self) -> None:
+        invalid_utf8 = b'{"key": "\xff"}'
+        prefix = struct.pack("!I", len(invalid_utf8))
+
+        reader = _create_reader_with_data(prefix + invalid_utf8)
+
+        with pytest.raises(IPCError):
+            await receive_message(reader)
+
     async def test_receive_truncated_payload_raises_error(self) -> None:
         payload = json.dumps({"key": "value"}).encode("utf-8")
         prefix = struct.pack("!I", len(payload))
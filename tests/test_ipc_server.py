@@ -27,6 +27,8 @@ from claudecode_model.ipc.protocol import (
     SOCKET_FILE_SUFFIX,
     SOCKET_PERMISSIONS,
     ToolSchema,
+    receive_message,
+    send_message,
 )
 from claudecode_model.ipc.server import (
     IPCServer,
@@ -283,6 +285,58 @@ class TestIPCServerErrorResponse:
         finally:
             await server.stop()
 
+    @pytest.mark.asyncio
+    async def test_unserializable_result_returns_error_response(
+        self, tmp_path: Path
+    ) -> None:
+        """A result that cannot be encoded is answered with IPCErrorResponse."""
+        socket_path = tmp_path / "test.sock"
+        mock = _mock_handler(return_value={"text": object()})
+        server = IPCServer(str(socket_path), _handlers(("bad_tool", mock)))
+
+        await server.start()
+        try:
+            response = await asyncio.wait_for(
+                _send_ipc_request(
+                    str(socket_path),
+                    "call_tool",
+                    {"name": "bad_tool", "arguments": {}},
+                ),
+                timeout=5,
+            )
+            assert _error(response)["type"] == "PydanticSerializationError"
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_unsendable_error_response_closes_connection(
+        self, tmp_path: Path
+    ) -> None:
+        """If no response can be encoded, the connection is closed."""
+        socket_path = tmp_path / "test.sock"
+        mock = _mock_handler(return_value={"content": []})
+        server = IPCServer(str(socket_path), _handlers(("tool", mock)))
+
+        await server.start()
+        try:
+            with (
+                patch(
+                    "claudecode_model.ipc.server.send_message",
+                    side_effect=TypeError("cannot encode"),
+                ),
+                pytest.raises(asyncio.IncompleteReadError),
+            ):
+                await asyncio.wait_for(
+                    _send_ipc_request(
+                        str(socket_path),
+                        "call_tool",
+                        {"name": "tool", "arguments": {}},
+                    ),
+                    timeout=5,
+                )
+        finally:
+            await server.stop()
+
 
 class TestIPCServerMultipleRequests:
     """IPCServer handles multiple sequential connections."""
@@ -467,6 +521,51 @@ class TestIPCServerPersistentConnection:
         finally:
             await server.stop()
 
+    @pytest.mark.asyncio
+    async def test_pipelined_requests_answered_by_id(self, tmp_path: Path) -> None:
+        """A slow request does not hold back a later one on the same connection."""
+        socket_path = tmp_path / "test.sock"
+        release_slow = asyncio.Event()
+
+        async def slow_handler(args: dict[str, object]) -> dict[str, object]:
+            await release_slow.wait()
+            return {"content": [{"type": "text", "text": "slow"}]}
+
+        async def fast_handler(args: dict[str, object]) -> dict[str, object]:
+            return {"content": [{"type": "text", "text": "fast"}]}
+
+        server = IPCServer(
+            str(socket_path), {"slow": slow_handler, "fast": fast_handler}
+        )
+
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_unix_connection(str(socket_path))
+            try:
+                for request_id, name in ((1, "slow"), (2, "fast")):
+                    await send_message(
+                        writer,
+                        {
+                            "id": request_id,
+                            "method": "call_tool",
+                            "params": {"name": name, "arguments": {}},
+                        },
+                    )
+
+                first = await receive_message(reader)
+                release_slow.set()
+                second = await receive_message(reader)
+
+                assert first["id"] == 2
+                assert _result(first)["content"][0]["text"] == "fast"  # type: ignore[index]
+                assert second["id"] == 1
+                assert _result(second)["content"][0]["text"] == "slow"  # type: ignore[index]
+            finally:
+                writer.close()
+                await writer.wait_closed()
+        finally:
+            await server.stop()
+
 
 # ── T013: IPCSession Tests ───────────────────────────────────────────────
 
@@ -507,6 +606,86 @@ class TestIPCSessionLifecycle:
         finally:
             await session.stop()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_start_starts_one_server(self) -> None:
+        """Concurrent start() calls share a single IPCServer."""
+        schemas: list[ToolSchema] = [
+            {"name": "t1", "description": "d1", "input_schema": {}},
+        ]
+        session = IPCSession(tool_handlers={}, tool_schemas=schemas)
+
+        with patch.object(IPCServer, "start", autospec=True) as mock_start:
+            await asyncio.gather(session.start(), session.start())
+
+        try:
+            mock_start.assert_called_once()
+        finally:
+            await session.stop()
+            await session.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_start_holds_no_reference(self) -> None:
+        """A start() that raises leaves no files and does not block later cleanup."""
+        schemas: list[ToolSchema] = [
+            {"name": "t1", "description": "d1", "input_schema": {}},
+        ]
+        session = IPCSession(tool_handlers={}, tool_schemas=schemas)
+
+        with (
+            patch.object(
+                IPCServer, "start", autospec=True, side_effect=OSError("bind failed")
+            ),
+            pytest.raises(OSError, match="bind failed"),
+        ):
+            await session.start()
+
+        assert not Path(session.schema_path).exists()
+
+        await session.start()
+        await session.stop()
+
+        assert session._active_count == 0
+        assert not Path(session.socket_path).exists()
+        assert not Path(session.schema_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_start_during_stop_restarts_server(self) -> None:
+        """A start() racing the last stop() waits and gets a running server."""
+        schemas: list[ToolSchema] = [
+            {"name": "t1", "description": "d1", "input_schema": {}},
+        ]
+        session = IPCSession(tool_handlers={}, tool_schemas=schemas)
+        await session.start()
+
+        original_stop = IPCServer.stop
+
+        async def slow_stop(server: IPCServer) -> None:
+            await asyncio.sleep(0)  # Let start() run while teardown is pending
+            await original_stop(server)
+
+        with patch.object(IPCServer, "stop", slow_stop):
+            await asyncio.gather(session.stop(), session.start())
+
+        try:
+            assert session._server is not None
+            assert Path(session.socket_path).exists()
+        finally:
+            await session.stop()
+
+    def test_session_reusable_on_a_new_event_loop(self) -> None:
+        """A session reused across asyncio.run() calls gets a fresh lock."""
+        session = IPCSession(tool_handlers={}, tool_schemas=[])
+
+        async def overlapping_requests() -> None:
+            # Contended start() calls bind the lock to the running loop
+            await asyncio.gather(session.start(), session.start())
+            await session.stop()
+            await session.stop()
+
+        asyncio.run(overlapping_requests())
+        asyncio.run(overlapping_requests())
+        assert not Path(session.socket_path).exists()
+
     @pytest.mark.asyncio
     async def test_stop_removes_socket_and_schema(self) -> None:
         """stop() removes socket file and schema file."""
@@ -549,6 +728,34 @@ class TestIPCSessionLifecycle:
         await session.stop()
         await session.stop()  # Should not raise
 
+    @pytest.mark.asyncio
+    async def test_overlapping_start_stop_keeps_server_until_last_stop(
+        self,
+    ) -> None:
+        """Nested start()/stop() pairs keep the server alive until the last stop."""
+        schemas: list[ToolSchema] = [
+            {"name": "t1", "description": "d1", "input_schema": {}},
+        ]
+
+        async def dummy_handler(args: dict[str, object]) -> dict[str, object]:
+            return {"content": [{"type": "text", "text": "ok"}]}
+
+        session = IPCSession(
+            tool_handlers={"t1": dummy_handler},
+            tool_schemas=schemas,
+        )
+
+        await session.start()
+        await session.start()
+        try:
+            await session.stop()
+            assert Path(session.socket_path).exists()
+            assert Path(session.schema_path).exists()
+        finally:
+            await session.stop()
+        assert not Path(session.socket_path).exists()
+        assert not Path(session.schema_path).exists()
+
 
 class TestIPCSessionSocketPath:
     """IPCSession socket path generation with UUID."""
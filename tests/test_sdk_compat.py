@@ -36,6 +36,19 @@ class TestSafeParseMessage:
         result = _safe_parse_message(data)
         assert result is None
 
+    def test_repeated_unknown_type_skips_sdk_parser(self) -> None:
+        """A type the SDK already rejected should not be re-parsed."""
+        data: dict[str, object] = {"type": "repeated_future_event"}
+        with patch(
+            "claudecode_model._sdk_compat._original_parse_message",
+            side_effect=MessageParseError(
+                f"{_UNKNOWN_TYPE_PREFIX}repeated_future_event", data
+            ),
+        ) as mock_parse:
+            assert _safe_parse_message(data) is None
+            assert _safe_parse_message(data) is None
+        mock_parse.assert_called_once_with(data)
+
     def test_logs_warning_for_unknown_message_type(
         self, caplog: pytest.LogCaptureFixture
     ) -> None:
@@ -60,6 +73,12 @@ class TestSafeParseMessage:
         with pytest.raises(MessageParseError, match="missing 'type' field"):
             _safe_parse_message(data)
 
+    @pytest.mark.parametrize("data", [["type", "result"], "result", None])
+    def test_raises_for_non_dict_data(self, data: object) -> None:
+        """_safe_parse_message should re-raise the SDK error for non-dict data."""
+        with pytest.raises(MessageParseError):
+            _safe_parse_message(data)  # type: ignore[arg-type]
+
     def test_passes_through_valid_result_message(self) -> None:
         """_safe_parse_message should return valid Message for known types."""
         data: dict[str, object] = {
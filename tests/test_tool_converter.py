@@ -702,3 +702,57 @@ class TestSerializableDepsSupport:
         assert "Async Fetched: async query" in output["content"][0]["text"]
         assert received_deps["api_url"] == "https://async.example.com"
         assert received_deps["timeout"] == 60
+
+    def test_repeated_conversion_returns_cached_tool(self) -> None:
+        """Same tool and deps objects should return the cached SdkMcpTool."""
+        from claudecode_model.tool_converter import (
+            clear_conversion_cache,
+            convert_tool_with_deps,
+        )
+
+        agent: Agent[_MyDeps] = Agent("test")
+
+        @agent.tool
+        def my_tool(ctx: RunContext[_MyDeps], name: str) -> str:
+            """Tool with ctx."""
+            return f"{ctx.deps.value}: {name}"
+
+        tool = get_agent_tools(agent)[0]
+        deps = _MyDeps(value="test")
+
+        first = convert_tool_with_deps(tool, deps)
+        assert convert_tool_with_deps(tool, deps) is first
+
+        # Different deps object (even if equal) gets its own conversion
+        assert convert_tool_with_deps(tool, _MyDeps(value="test")) is not first
+
+        clear_conversion_cache()
+        assert convert_tool_with_deps(tool, deps) is not first
+
+    def test_conversion_cache_entry_dropped_with_tool(self) -> None:
+        """The cache holds tools weakly and evicts collected tools."""
+        import gc
+
+        from claudecode_model.tool_converter import (
+            _convert_cache,
+            clear_conversion_cache,
+            convert_tool_with_deps,
+        )
+
+        agent: Agent[_MyDeps] = Agent("test")
+
+        @agent.tool
+        def my_tool(ctx: RunContext[_MyDeps], name: str) -> str:
+            """Tool with ctx."""
+            return f"{ctx.deps.value}: {name}"
+
+        clear_conversion_cache()
+        tool = get_agent_tools(agent)[0]
+        convert_tool_with_deps(tool, _MyDeps(value="test"))
+        assert id(tool) in _convert_cache
+
+        key = id(tool)
+        del tool, agent, my_tool
+        gc.collect()
+
+        assert key not in _convert_cache